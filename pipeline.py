@@ -3,25 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
 import subprocess
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 import click
 
-from techslop.config import settings
-from techslop.db import (
-    create_video_job,
-    get_all_stories,
-    get_top_new_stories,
-    init_db,
-    update_story_status,
-    update_video_job,
-    upsert_story,
-)
-from techslop.models import VideoJob
+from techslop.config import get_settings, preload_settings
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+# DB and pipeline-stage modules are imported inside the commands that use
+# them, so `--help` and other light commands don't pay for them at startup.
 
 
 @click.group()
@@ -44,8 +43,7 @@ def cli():
         pipeline.py preview         # Auto: ingest → … → video, open locally (no upload)
         pipeline.py run             # Auto: ingest → … → publish to all enabled platforms
     """
-    init_db()
-    Path(settings.output_dir).mkdir(parents=True, exist_ok=True)
+    Path(get_settings().output_dir).mkdir(parents=True, exist_ok=True)
 
 
 # ---------------------------------------------------------------------------
@@ -56,14 +54,10 @@ def cli():
 @cli.command()
 def ingest():
     """Fetch and score stories from all sources."""
-    from techslop.ingest.sources import ingest_all
-
-    stories = asyncio.run(ingest_all())
-    for story in stories:
-        upsert_story(story)
-    click.echo(f"Ingested {len(stories)} stories.")
+    count, top = asyncio.run(_ingest_and_store())
+    click.echo(f"Ingested {count} stories.")
     click.echo("\nTop 5:")
-    for s in stories[:5]:
+    for s in top:
         click.echo(f"  {s.score:.2f}  [{s.source:<12}] {s.title[:65]}")
     click.echo(f"\nRun 'pipeline.py list' to see all, or 'pipeline.py script <ID>' to generate a script.")
 
@@ -79,23 +73,23 @@ def ingest():
 @click.option("--limit", default=20, help="Max stories to show.")
 def list_stories(status, source, limit):
     """Show stories and their statuses."""
-    stories = get_all_stories()
+    from techslop.db import count_stories, get_story_summaries
+
+    _ensure_db()
+    stories = get_story_summaries(status=status, source=source, limit=limit)
     if not stories:
         click.echo("No stories found. Run 'ingest' first.")
         return
 
-    if status:
-        stories = [s for s in stories if s.status == status]
-    if source:
-        stories = [s for s in stories if s.source == source]
+    # One echo for the whole listing: click.echo flushes on every call.
+    lines = []
+    for s in stories:
+        ctx = f"+{s.comment_count}c" if s.comment_count else ""
+        lines.append(f"  [{s.status:>10}] {s.score:.2f}  {s.source:<12} {s.title[:55]} {ctx}")
+        lines.append(f"             ID: {s.id[:12]}  URL: {s.url[:60]}")
+    click.echo("\n".join(lines))
 
-    for s in stories[:limit]:
-        comments = len(s.raw_data.get("comments", []))
-        ctx = f"+{comments}c" if comments else ""
-        click.echo(f"  [{s.status:>10}] {s.score:.2f}  {s.source:<12} {s.title[:55]} {ctx}")
-        click.echo(f"             ID: {s.id[:12]}  URL: {s.url[:60]}")
-
-    total = len(stories)
+    total = count_stories(status=status, source=source) if len(stories) == limit else len(stories)
     if total > limit:
         click.echo(f"\n  ... and {total - limit} more. Use --limit to show more.")
 
@@ -104,18 +98,19 @@ def list_stories(status, source, limit):
 @click.argument("story_id")
 def show(story_id):
     """Show full details for a story (by ID prefix)."""
-    story = _find_story(story_id)
+    story = _find_story_context(story_id)
     if not story:
         return
 
-    click.echo(f"Title:     {story.title}")
-    click.echo(f"Source:    {story.source}")
-    click.echo(f"URL:       {story.url}")
-    click.echo(f"Score:     {story.score:.3f}")
-    click.echo(f"Status:    {story.status}")
-    click.echo(f"Published: {story.published_at}")
+    click.echo(f"Title:     {story['title']}")
+    click.echo(f"Source:    {story['source']}")
+    click.echo(f"URL:       {story['url']}")
+    click.echo(f"Score:     {story['score']:.3f}")
+    click.echo(f"Status:    {story['status']}")
+    click.echo(f"Published: {_published(story)}")
 
-    comments = story.raw_data.get("comments", [])
+    raw_data = story["raw_data"]
+    comments = raw_data.get("comments", [])
     if comments:
         click.echo(f"\nComments ({len(comments)}):")
         for c in comments:
@@ -124,8 +119,8 @@ def show(story_id):
             else:
                 click.echo(f"  {str(c)[:150]}")
 
-    if story.raw_data.get("tweet_text"):
-        click.echo(f"\nTweet: {story.raw_data['tweet_text'][:300]}")
+    if raw_data.get("tweet_text"):
+        click.echo(f"\nTweet: {raw_data['tweet_text'][:300]}")
 
 
 # ---------------------------------------------------------------------------
@@ -143,44 +138,45 @@ def context(limit, source, status):
     Gathers everything from all sources into one big context dump so you can
     pick the best stuff and craft a script in Claude Code.
     """
-    stories = get_all_stories()
+    from techslop.db import get_stories_filtered
+
+    _ensure_db()
+    stories = get_stories_filtered(status=status, source=source, limit=limit)
     if not stories:
         click.echo("No stories found. Run 'ingest' first.")
         return
 
-    if source:
-        stories = [s for s in stories if s.source == source]
-    if status:
-        stories = [s for s in stories if s.status == status]
-
-    stories = stories[:limit]
-
     click.echo(f"\n{'='*70}")
     click.echo(f"ALL STORIES CONTEXT ({len(stories)} stories)")
     click.echo(f"{'='*70}")
 
+    # Collected and echoed once: click.echo flushes on every call, and a
+    # full dump is several lines per story.
+    lines = []
     for i, story in enumerate(stories, 1):
-        click.echo(f"\n{'─'*70}")
-        click.echo(f"[{i}] {story.title}")
-        click.echo(f"    Source: {story.source}  |  Score: {story.score:.2f}  |  ID: {story.id[:12]}")
-        click.echo(f"    URL: {story.url}")
+        raw_data = story.raw_data
+        lines.append(f"\n{'─'*70}")
+        lines.append(f"[{i}] {story.title}")
+        lines.append(f"    Source: {story.source}  |  Score: {story.score:.2f}  |  ID: {story.id[:12]}")
+        lines.append(f"    URL: {story.url}")
 
-        comments = story.raw_data.get("comments", [])
+        comments = raw_data.get("comments", [])
         if comments:
-            click.echo(f"    Comments ({len(comments)}):")
+            lines.append(f"    Comments ({len(comments)}):")
             for c in comments[:5]:
                 if isinstance(c, dict):
                     text = c.get("text", "")[:200]
                     author = c.get("author", "anon")
-                    click.echo(f"      [{author}]: {text}")
+                    lines.append(f"      [{author}]: {text}")
                 else:
-                    click.echo(f"      {str(c)[:200]}")
+                    lines.append(f"      {str(c)[:200]}")
 
-        if story.raw_data.get("tweet_text"):
-            click.echo(f"    Tweet: {story.raw_data['tweet_text'][:300]}")
+        if raw_data.get("tweet_text"):
+            lines.append(f"    Tweet: {raw_data['tweet_text'][:300]}")
 
-        if story.raw_data.get("summary"):
-            click.echo(f"    Summary: {story.raw_data['summary'][:300]}")
+        if raw_data.get("summary"):
+            lines.append(f"    Summary: {raw_data['summary'][:300]}")
+    click.echo("\n".join(lines))
 
     click.echo(f"\n{'='*70}")
     click.echo(f"Pick stories to combine into a script. Save to output/<id>/script.json")
@@ -207,20 +203,24 @@ def script(story_id, interactive):
     so you can collaborate on the script in Claude Code, then save it
     by editing output/<id>/script.json directly.
     """
+    if interactive:
+        ctx = _find_story_context(story_id)
+        if not ctx:
+            return
+        _dump_story_context(ctx)
+        click.echo(f"\nScript file: {StoryPaths.for_story(ctx['id']).script}")
+        click.echo("Craft the script here, then I'll save it to script.json.")
+        click.echo("When done, run: pipeline.py voice " + ctx["id"][:12])
+        return
+
     story = _find_story(story_id)
     if not story:
         return
 
-    story_dir = _story_dir(story.id)
-    script_path = story_dir / "script.json"
-
-    if interactive:
-        _dump_story_context(story)
-        click.echo(f"\nScript file: {script_path}")
-        click.echo("Craft the script here, then I'll save it to script.json.")
-        click.echo("When done, run: pipeline.py voice " + story.id[:12])
-        return
+    script_path = StoryPaths.for_story(story.id).script
 
+    from techslop.db import create_video_job, update_story_status
+    from techslop.models import VideoJob
     from techslop.scriptgen.generator import generate_script
 
     click.echo(f"Generating script for: {story.title[:60]}...")
@@ -254,23 +254,24 @@ def voice(story_id):
     if not story:
         return
 
-    story_dir = _story_dir(story.id)
-    script_path = story_dir / "script.json"
+    paths = StoryPaths.for_story(story.id)
+    script_path = paths.script
     if not script_path.exists():
         click.echo(f"No script found. Run 'script {story_id}' first.")
         return
 
     script_obj = _load_script_json(script_path, story.id)
 
+    settings = get_settings()
     tts = TTSProvider.from_config(settings)
-    audio_path = story_dir / "narration.mp3"
+    audio_path = paths.audio
 
     click.echo(f"Synthesizing voice ({settings.tts_provider})...")
     asyncio.run(tts.synthesize(script_obj.full_text, audio_path))
     click.echo(f"Audio: {audio_path}")
 
     click.echo("Extracting word timestamps...")
-    timestamps_path = story_dir / "timestamps.json"
+    timestamps_path = paths.timestamps
     extract_timestamps(audio_path, timestamps_path)
     click.echo(f"Timestamps: {timestamps_path}")
 
@@ -298,15 +299,16 @@ def shots(story_id):
     if not story:
         return
 
-    story_dir = _story_dir(story.id)
-    script_path = story_dir / "script.json"
+    paths = StoryPaths.for_story(story.id)
+    script_path = paths.script
     if not script_path.exists():
         click.echo(f"No script found. Run 'script {story_id}' first.")
         return
 
     script_obj = _load_script_json(script_path, story.id)
-    shots_dir = story_dir / "shots"
+    shots_dir = paths.shots
     shots_dir.mkdir(parents=True, exist_ok=True)
+    settings = get_settings()
 
     click.echo(f"Generating grid via gpt-image-2 ({len(script_obj.body)} panels)...")
     grid_path = generate_grid(
@@ -348,58 +350,71 @@ def shots(story_id):
 @cli.command()
 @click.argument("story_id")
 @click.option("--open", "open_video", is_flag=True, default=True, help="Open video after assembly.")
-def video(story_id, open_video):
+@click.option("--hw/--no-hw", default=None, help="Hardware H.264 encoding (default: HW_ENCODER).")
+def video(story_id, open_video, hw):
     """Assemble the final video. Uses motion clips if present, else falls back to a static background."""
-    from techslop.video.assembler import (
-        assemble_video_motion,
-        assemble_video_static,
-        get_audio_duration,
-    )
-    from techslop.video.assets import generate_background
+    from techslop.db import update_story_status
+    from techslop.video.assembler import assemble_video_motion, assemble_video_static
     from techslop.video.captions import generate_captions
+    from techslop.video.stamps import input_digest, is_fresh, write_stamp
 
     story = _find_story(story_id)
     if not story:
         return
 
-    story_dir = _story_dir(story.id)
-    audio_path = story_dir / "narration.mp3"
-    timestamps_path = story_dir / "timestamps.json"
+    paths = StoryPaths.for_story(story.id)
+    audio_path = paths.audio
+    timestamps_path = paths.timestamps
 
     if not audio_path.exists():
         click.echo(f"No audio found. Run 'voice {story_id}' first.")
         return
 
-    click.echo("Generating captions...")
-    captions_path = story_dir / "captions.ass"
-    generate_captions(timestamps_path, captions_path)
+    captions_path = paths.captions
+    captions_digest = input_digest(timestamps_path)
+    if is_fresh(captions_path, captions_digest):
+        click.echo("Captions unchanged — reusing.")
+    else:
+        click.echo("Generating captions...")
+        generate_captions(timestamps_path, captions_path)
+        write_stamp(captions_path, captions_digest)
 
-    video_path = story_dir / "output.mp4"
-    shots_dir = story_dir / "shots"
+    video_path = paths.video
+    shots_dir = paths.shots
     motion_clips = sorted(shots_dir.glob("clip_*.mp4")) if shots_dir.exists() else []
+    video_encoder = _video_encoder(hw)
 
     if motion_clips:
-        click.echo(f"Assembling motion video from {len(motion_clips)} clips...")
-        assemble_video_motion(
-            clip_paths=motion_clips,
-            audio_path=audio_path,
-            captions_path=captions_path,
-            output_path=video_path,
-            title=story.title,
-        )
+        video_digest = input_digest("motion", video_encoder, story.title, audio_path, captions_path, *motion_clips)
+        if is_fresh(video_path, video_digest):
+            click.echo("Inputs unchanged — reusing existing video.")
+        else:
+            click.echo(f"Assembling motion video from {len(motion_clips)} clips ({video_encoder})...")
+            assemble_video_motion(
+                clip_paths=motion_clips,
+                audio_path=audio_path,
+                captions_path=captions_path,
+                output_path=video_path,
+                title=story.title,
+                encoder=video_encoder,
+            )
+            write_stamp(video_path, video_digest)
     else:
         click.echo("No motion clips found — falling back to static background.")
-        bg_path = story_dir / "background.png"
-        generate_background(bg_path)
-        duration = get_audio_duration(audio_path)
-        assemble_video_static(
-            audio_path=audio_path,
-            captions_path=captions_path,
-            background_path=bg_path,
-            output_path=video_path,
-            title=story.title,
-            duration=duration,
-        )
+        bg_path = _ensure_background(paths.bg)
+        video_digest = input_digest("static", video_encoder, story.title, audio_path, captions_path, bg_path)
+        if is_fresh(video_path, video_digest):
+            click.echo("Inputs unchanged — reusing existing video.")
+        else:
+            assemble_video_static(
+                audio_path=audio_path,
+                captions_path=captions_path,
+                background_path=bg_path,
+                output_path=video_path,
+                title=story.title,
+                encoder=video_encoder,
+            )
+            write_stamp(video_path, video_digest)
 
     update_story_status(story.id, "rendered")
     click.echo(f"Video: {video_path}")
@@ -424,13 +439,15 @@ def video(story_id, open_video):
 @click.option("--linkedin/--no-linkedin", default=False, help="Upload to LinkedIn.")
 def publish(story_id, all_platforms, youtube, tiktok, instagram, linkedin):
     """Upload a rendered video to platforms."""
+    from techslop.db import update_story_status
+
     story = _find_story(story_id)
     if not story:
         return
 
-    story_dir = _story_dir(story.id)
-    video_path = story_dir / "output.mp4"
-    script_path = story_dir / "script.json"
+    paths = StoryPaths.for_story(story.id)
+    video_path = paths.video
+    script_path = paths.script
 
     if not video_path.exists():
         click.echo(f"No video found. Run 'video {story_id}' first.")
@@ -444,43 +461,21 @@ def publish(story_id, all_platforms, youtube, tiktok, instagram, linkedin):
     title = f"{story.title[:90]} #Shorts"
 
     if all_platforms:
+        settings = get_settings()
         youtube = bool(settings.youtube_refresh_token)
         tiktok = bool(settings.tiktok_refresh_token)
         instagram = bool(settings.instagram_access_token)
         linkedin = bool(settings.linkedin_access_token)
 
-    if youtube:
-        click.echo("Uploading to YouTube...")
-        from techslop.publish.youtube import upload_to_youtube
-
-        yt_id = upload_to_youtube(
-            video_path=video_path,
-            title=title,
-            description=description,
-            tags=["tech", "news", "shorts", story.source],
-        )
-        click.echo(f"  YouTube: https://youtube.com/shorts/{yt_id}")
-
-    if tiktok:
-        click.echo("Uploading to TikTok...")
-        from techslop.publish.tiktok import upload_to_tiktok
-
-        publish_id = upload_to_tiktok(video_path, title)
-        click.echo(f"  TikTok publish_id: {publish_id} (check mobile drafts inbox)")
-
-    if instagram:
-        click.echo("Uploading to Instagram...")
-        from techslop.publish.instagram import upload_to_instagram
-
-        media_id = upload_to_instagram(video_path, title)
-        click.echo(f"  Instagram media_id: {media_id}")
-
-    if linkedin:
-        click.echo("Uploading to LinkedIn...")
-        from techslop.publish.linkedin import upload_to_linkedin
-
-        post_id = upload_to_linkedin(video_path, title, description)
-        click.echo(f"  LinkedIn post: {post_id}")
+    uploads = _upload_calls(
+        video_path, title, description, ["tech", "news", "shorts", story.source],
+        youtube=youtube, tiktok=tiktok, instagram=instagram, linkedin=linkedin,
+    )
+    click.echo(f"Uploading to {', '.join(uploads) or 'no platforms'}...")
+    results = asyncio.run(_publish_all(uploads))
+    failed = _report_uploads(results, click.echo)
+    if failed:
+        raise click.ClickException(f"Upload failed on {', '.join(failed)}.")
 
     update_story_status(story.id, "published")
     click.echo("Done!")
@@ -493,16 +488,20 @@ def publish(story_id, all_platforms, youtube, tiktok, instagram, linkedin):
 
 @cli.command()
 @click.option("--count", default=1, help="Number of stories to process.")
-def preview(count):
+@click.option("--parallel-encode", type=int, default=None, help="Concurrent ffmpeg encodes (default: ENCODE_CONCURRENCY).")
+@click.option("--hw/--no-hw", default=None, help="Hardware H.264 encoding (default: HW_ENCODER).")
+def preview(count, parallel_encode, hw):
     """Auto-pick top story, generate full video, open it. No upload."""
-    _run_pipeline(count=count, upload=False)
+    _run_pipeline(count=count, upload=False, parallel_encode=parallel_encode, hw=hw)
 
 
 @cli.command()
 @click.option("--count", default=1, help="Number of stories to process.")
-def run(count):
+@click.option("--parallel-encode", type=int, default=None, help="Concurrent ffmpeg encodes (default: ENCODE_CONCURRENCY).")
+@click.option("--hw/--no-hw", default=None, help="Hardware H.264 encoding (default: HW_ENCODER).")
+def run(count, parallel_encode, hw):
     """Full auto pipeline: ingest → script → voice → video → upload."""
-    _run_pipeline(count=count, upload=True)
+    _run_pipeline(count=count, upload=True, parallel_encode=parallel_encode, hw=hw)
 
 
 # ---------------------------------------------------------------------------
@@ -510,66 +509,199 @@ def run(count):
 # ---------------------------------------------------------------------------
 
 
+_db_ready = False
+
+
+def _ensure_db() -> None:
+    """Create the schema on first DB use; later calls in the process are no-ops."""
+    global _db_ready
+    if not _db_ready:
+        from techslop.db import init_db
+
+        init_db()
+        _db_ready = True
+
+
 def _find_story(story_id_prefix: str):
     """Find a story by ID prefix."""
-    stories = get_all_stories()
-    matches = [s for s in stories if s.id.startswith(story_id_prefix)]
+    from techslop.db import get_story, get_story_ids_by_prefix
+
+    _ensure_db()
+    matches = get_story_ids_by_prefix(story_id_prefix)
     if not matches:
         click.echo(f"No story found matching '{story_id_prefix}'. Run 'list' to see IDs.")
         return None
     if len(matches) > 1:
-        click.echo(f"Multiple matches for '{story_id_prefix}'. Be more specific:")
-        for s in matches:
-            click.echo(f"  {s.id[:12]}  {s.title[:50]}")
+        _echo_ambiguous(story_id_prefix, matches)
+        return None
+    # Only the single match is loaded in full.
+    return get_story(matches[0][0])
+
+
+def _find_story_context(story_id_prefix: str) -> dict | None:
+    """Like _find_story, but returns get_story_context's display dict."""
+    from techslop.db import get_story_context, get_story_ids_by_prefix
+
+    _ensure_db()
+    matches = get_story_context(story_id_prefix, limit=2)
+    if not matches:
+        click.echo(f"No story found matching '{story_id_prefix}'. Run 'list' to see IDs.")
+        return None
+    if len(matches) > 1:
+        _echo_ambiguous(story_id_prefix, get_story_ids_by_prefix(story_id_prefix))
         return None
     return matches[0]
 
 
-def _story_dir(story_id: str) -> Path:
-    d = Path(settings.output_dir) / story_id[:12]
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+def _echo_ambiguous(story_id_prefix: str, matches: list[tuple[str, str]]) -> None:
+    click.echo(f"Multiple matches for '{story_id_prefix}'. Be more specific:")
+    for sid, title in matches:
+        click.echo(f"  {sid[:12]}  {title[:50]}")
+
+
+INGEST_BATCH_SIZE = 64
+
+
+def _merge_top(top: list, batch: list, top_n: int) -> list:
+    """Best ``top_n`` stories across ``top`` and a new batch, by score."""
+    # Later copies of a story outscore earlier ones, so last one wins.
+    merged = {s.id: s for s in (*top, *batch)}
+    return heapq.nlargest(top_n, merged.values(), key=lambda s: s.score)
+
+
+async def _ingest_and_store(top_n: int = 5) -> tuple[int, list]:
+    """Stream stories from every source into the DB in batches.
+
+    DB writes run in a worker thread while the remaining sources are still
+    fetching, so network latency and SQLite writes overlap instead of
+    running back to back.
+
+    Returns (number of unique stories stored, top ``top_n`` by score).
+    """
+    from techslop.db import upsert_stories
+    from techslop.ingest.sources import ingest_stream
+
+    _ensure_db()
+    seen: set[str] = set()
+    top: list = []
+    buf: list = []
+
+    async def flush(batch: list, previous: asyncio.Task | None) -> None:
+        nonlocal top
+        # Later copies of a story outscore earlier ones and upserts overwrite
+        # the score, so batches must land in order: chain on the previous one.
+        if previous is not None:
+            await previous
+        ids = await asyncio.to_thread(upsert_stories, batch)
+        # A URL first stored under a legacy id keeps it; adopt the stored id
+        # so jobs and output/ directories key on the row that exists.
+        for story, stored_id in zip(batch, ids):
+            story.id = stored_id
+        seen.update(ids)
+        top = _merge_top(top, batch, top_n)
+
+    # Flushes run as background tasks, so the stream keeps pulling (and
+    # sources keep fetching) while a batch is being written.
+    async with asyncio.TaskGroup() as tg:
+        last: asyncio.Task | None = None
+        async for story in ingest_stream():
+            buf.append(story)
+            if len(buf) >= INGEST_BATCH_SIZE:
+                last = tg.create_task(flush(buf, last))
+                buf = []
+        if buf:
+            tg.create_task(flush(buf, last))
+
+    return len(seen), top
+
+
+@dataclass(slots=True)
+class StoryPaths:
+    """Every file a story's run reads or writes, under output/<id12>/."""
+
+    dir: Path
+    script: Path
+    audio: Path
+    timestamps: Path
+    captions: Path
+    shots: Path
+    bg: Path
+    video: Path
+
+    @classmethod
+    def for_story(cls, story_id: str) -> StoryPaths:
+        d = Path(get_settings().output_dir) / story_id[:12]
+        d.mkdir(parents=True, exist_ok=True)
+        return cls(
+            dir=d,
+            script=d / "script.json",
+            audio=d / "narration.mp3",
+            timestamps=d / "timestamps.json",
+            captions=d / "captions.ass",
+            shots=d / "shots",
+            bg=d / "background.png",
+            video=d / "output.mp4",
+        )
+
+
+def _video_encoder(hw: bool | None) -> str:
+    """Resolve --hw/--no-hw (None = use HW_ENCODER) to an ffmpeg encoder name."""
+    from techslop.video.assembler import select_video_encoder
+
+    setting = get_settings().hw_encoder
+    if hw is False:
+        setting = "off"
+    elif hw and setting == "off":
+        setting = "auto"
+    return select_video_encoder(setting)
+
+
+def _ensure_background(bg_path: Path) -> Path:
+    """Render the static fallback background unless an up-to-date one exists."""
+    from techslop.video import assets
+    from techslop.video.stamps import input_digest, is_fresh, write_stamp
+
+    digest = input_digest("background", assets.background_key())
+    if not is_fresh(bg_path, digest):
+        assets.cached_background(bg_path, Path(get_settings().output_dir) / ".cache")
+        write_stamp(bg_path, digest)
+    return bg_path
 
 
 def _save_script_json(script_obj, path: Path):
-    data = {
-        "story_id": script_obj.story_id,
-        "hook": script_obj.hook,
-        "body": [
-            {"text": s.text, "screen_text": s.screen_text, "duration_hint": s.duration_hint}
-            for s in script_obj.body
-        ],
-        "cta": script_obj.cta,
-        "full_text": script_obj.full_text,
-    }
-    path.write_text(json.dumps(data, indent=2))
+    from techslop.scriptgen.script_file import save_script
+
+    save_script(script_obj, path)
 
 
 def _load_script_json(path: Path, story_id: str):
-    from techslop.models import Script, ScriptSection
-
-    data = json.loads(path.read_text())
-    return Script(
-        story_id=data.get("story_id", story_id),
-        hook=data["hook"],
-        body=[ScriptSection(**s) for s in data["body"]],
-        cta=data["cta"],
-        full_text=data["full_text"],
-    )
+    from techslop.scriptgen.script_file import load_script
 
+    return load_script(path, story_id)
 
-def _dump_story_context(story):
-    """Print all raw context for a story — used in interactive script crafting."""
+
+def _published(story: dict) -> datetime | None:
+    """A ``get_story_context`` dict's ISO ``published_at``, as a datetime again."""
+    published = story["published_at"]
+    return datetime.fromisoformat(published) if published else None
+
+
+def _dump_story_context(story: dict):
+    """Print all raw context for a story — used in interactive script crafting.
+
+    Takes a ``get_story_context`` dict rather than a Story.
+    """
     click.echo(f"\n{'='*70}")
     click.echo(f"STORY CONTEXT")
     click.echo(f"{'='*70}")
-    click.echo(f"Title:     {story.title}")
-    click.echo(f"Source:    {story.source}")
-    click.echo(f"URL:       {story.url}")
-    click.echo(f"Score:     {story.score:.3f}")
-    click.echo(f"Published: {story.published_at}")
-
-    comments = story.raw_data.get("comments", [])
+    click.echo(f"Title:     {story['title']}")
+    click.echo(f"Source:    {story['source']}")
+    click.echo(f"URL:       {story['url']}")
+    click.echo(f"Score:     {story['score']:.3f}")
+    click.echo(f"Published: {_published(story)}")
+
+    raw_data = story["raw_data"]
+    comments = raw_data.get("comments", [])
     if comments:
         click.echo(f"\n--- Community Reactions ({len(comments)}) ---")
         for c in comments:
@@ -581,12 +713,12 @@ def _dump_story_context(story):
             else:
                 click.echo(f"\n  {str(c)[:500]}")
 
-    if story.raw_data.get("tweet_text"):
+    if raw_data.get("tweet_text"):
         click.echo(f"\n--- Tweet ---")
-        click.echo(f"  {story.raw_data['tweet_text'][:500]}")
+        click.echo(f"  {raw_data['tweet_text'][:500]}")
 
     # Show any other useful raw_data
-    summary = story.raw_data.get("summary")
+    summary = raw_data.get("summary")
     if summary:
         click.echo(f"\n--- Summary ---")
         click.echo(f"  {summary[:500]}")
@@ -618,169 +750,336 @@ def _print_script(script_obj):
 
 
 def _open_file(path: Path):
+    """Open ``path`` in the desktop's default app without waiting for it."""
     if sys.platform == "darwin":
-        subprocess.run(["open", str(path)])
+        cmd = ["open", str(path)]
     elif sys.platform == "linux":
-        subprocess.run(["xdg-open", str(path)])
-
-
-def _run_pipeline(count: int = 1, upload: bool = False):
-    from techslop.image_gen.grid import generate_grid, grid_shape
-    from techslop.image_gen.split import split_grid
-    from techslop.ingest.sources import ingest_all
-    from techslop.motion.kling import animate_shots
-    from techslop.scriptgen.generator import generate_script
-    from techslop.video.assembler import (
-        assemble_video_motion,
-        assemble_video_static,
-        get_audio_duration,
+        cmd = ["xdg-open", str(path)]
+    else:
+        return
+    subprocess.Popen(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
     )
-    from techslop.video.assets import generate_background
-    from techslop.video.captions import generate_captions
-    from techslop.voice.base import TTSProvider
-    from techslop.voice.timestamps import extract_timestamps
 
-    motion_enabled = bool(settings.fal_key)
 
-    click.echo("Ingesting stories...")
-    stories = asyncio.run(ingest_all())
-    for story in stories:
-        upsert_story(story)
-    click.echo(f"  Found {len(stories)} stories.")
+def _upload_calls(
+    video_path: Path,
+    title: str,
+    description: str,
+    tags: list[str],
+    *,
+    youtube: bool,
+    tiktok: bool,
+    instagram: bool,
+    linkedin: bool,
+) -> dict[str, Callable[[], str]]:
+    """Map each selected platform name to a ready-to-run upload call."""
+    calls: dict[str, Callable[[], str]] = {}
+    if youtube:
+        from techslop.publish.youtube import upload_to_youtube
 
-    top_stories = get_top_new_stories(limit=count)
-    if not top_stories:
-        click.echo("No new stories to process.")
-        return
+        calls["YouTube"] = partial(
+            upload_to_youtube,
+            video_path=video_path, title=title, description=description, tags=tags,
+        )
+    if tiktok:
+        from techslop.publish.tiktok import upload_to_tiktok
 
-    tts = TTSProvider.from_config(settings)
+        calls["TikTok"] = partial(upload_to_tiktok, video_path, title)
+    if instagram:
+        from techslop.publish.instagram import upload_to_instagram
 
-    for story in top_stories:
-        click.echo(f"\nProcessing: {story.title[:60]}...")
+        calls["Instagram"] = partial(upload_to_instagram, video_path, title)
+    if linkedin:
+        from techslop.publish.linkedin import upload_to_linkedin
 
-        job = VideoJob(story_id=story.id)
-        job_id = create_video_job(job)
-        story_dir = _story_dir(story.id)
+        calls["LinkedIn"] = partial(upload_to_linkedin, video_path, title, description)
+    return calls
 
-        click.echo("  Generating script...")
-        script_obj = asyncio.run(generate_script(story))
-        _save_script_json(script_obj, story_dir / "script.json")
-        update_video_job(job_id, script=script_obj, status="scripted")
-        update_story_status(story.id, "scripted")
 
-        click.echo("  Synthesizing voice...")
-        audio_path = story_dir / "narration.mp3"
-        asyncio.run(tts.synthesize(script_obj.full_text, audio_path))
-        update_video_job(job_id, audio_path=audio_path, status="voiced")
+async def _publish_all(uploads: dict[str, Callable[[], str]]) -> dict[str, str | BaseException]:
+    """Run every platform upload at once, each in a worker thread.
 
-        click.echo("  Extracting timestamps...")
-        timestamps_path = story_dir / "timestamps.json"
-        extract_timestamps(audio_path, timestamps_path)
+    The uploaders share no state, so total time is the slowest platform
+    rather than the sum. Returns each platform's result or the exception
+    it raised.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(call) for call in uploads.values()),
+        return_exceptions=True,
+    )
+    return dict(zip(uploads, results))
 
-        click.echo("  Generating captions...")
-        captions_path = story_dir / "captions.ass"
-        generate_captions(timestamps_path, captions_path)
 
-        motion_clips: list[Path] = []
-        if motion_enabled:
-            click.echo("  Generating gpt-image-2 grid...")
-            shots_dir = story_dir / "shots"
-            shots_dir.mkdir(parents=True, exist_ok=True)
-            grid_path = generate_grid(
-                script=script_obj,
-                output_path=shots_dir / "grid.png",
-                character_brief=settings.character_brief,
-                size=settings.image_size,
-            )
-            rows, cols = grid_shape(len(script_obj.body))
-            keyframes = split_grid(grid_path, rows=rows, cols=cols, output_dir=shots_dir)
-
-            click.echo(f"  Animating {len(keyframes)} shots via Kling i2v...")
-            motion_prompts = [
-                (s.screen_text or s.text[:60]) + ", subtle cinematic camera motion"
-                for s in script_obj.body[: len(keyframes)]
-            ]
-            motion_clips = asyncio.run(
-                animate_shots(
-                    image_paths=keyframes,
-                    motion_prompts=motion_prompts,
-                    output_dir=shots_dir,
-                    duration=settings.motion_duration,
-                )
-            )
+_UPLOAD_RESULT_FORMATS = {
+    "YouTube": "YouTube: https://youtube.com/shorts/{}",
+    "TikTok": "TikTok publish_id: {} (check mobile drafts inbox)",
+    "Instagram": "Instagram media_id: {}",
+    "LinkedIn": "LinkedIn post: {}",
+}
 
-        click.echo("  Assembling video...")
-        video_path = story_dir / "output.mp4"
-        if motion_clips:
-            assemble_video_motion(
-                clip_paths=motion_clips,
-                audio_path=audio_path,
-                captions_path=captions_path,
-                output_path=video_path,
-                title=story.title,
-            )
+
+def _report_uploads(results: dict[str, str | BaseException], echo: Callable[[str], None]) -> list[str]:
+    """Echo one line per platform; return the platforms whose upload failed."""
+    failed = []
+    for platform, result in results.items():
+        if isinstance(result, BaseException):
+            echo(f"  {platform} failed: {result}")
+            failed.append(platform)
         else:
-            bg_path = story_dir / "background.png"
-            generate_background(bg_path)
-            duration = get_audio_duration(audio_path)
-            assemble_video_static(
-                audio_path=audio_path,
-                captions_path=captions_path,
-                background_path=bg_path,
-                output_path=video_path,
-                title=story.title,
-                duration=duration,
-            )
-        update_video_job(job_id, video_path=video_path, status="rendered")
-        update_story_status(story.id, "rendered")
-        click.echo(f"  Video: {video_path}")
+            echo("  " + _UPLOAD_RESULT_FORMATS[platform].format(result))
+    return failed
+
+
+def _run_pipeline(
+    count: int = 1,
+    upload: bool = False,
+    parallel_encode: int | None = None,
+    hw: bool | None = None,
+):
+    encode_workers = parallel_encode or get_settings().encode_concurrency
+    video_encoder = _video_encoder(hw)
+    click.echo(f"Video encoder: {video_encoder}")
+    top_stories, results = asyncio.run(
+        _pipeline_main(count, upload, encode_workers, video_encoder)
+    )
+    if not top_stories:
+        return
 
-        if upload:
-            description = f"{script_obj.hook}\n\nSource: {story.url}\n\n#tech #news #shorts"
-            title = f"{story.title[:90]} #Shorts"
-            tags = ["tech", "news", "shorts", story.source]
+    if not upload:
+        # Opened once every encode is done, not interleaved with them.
+        preview_paths = [r for r in results if isinstance(r, Path)]
+        for path in preview_paths:
+            _open_file(path)
 
-            yt_id = None
-            if settings.youtube_refresh_token:
-                click.echo("  Uploading to YouTube...")
-                from techslop.publish.youtube import upload_to_youtube
+    failed = [(s, r) for s, r in zip(top_stories, results) if isinstance(r, BaseException)]
+    for story, exc in failed:
+        click.echo(f"\nFailed: {story.title[:60]} — {exc}")
+    if failed:
+        raise click.ClickException(f"{len(failed)} of {len(top_stories)} stories failed.")
 
-                yt_id = upload_to_youtube(
-                    video_path=video_path, title=title, description=description, tags=tags,
-                )
-                click.echo(f"    YouTube: https://youtube.com/shorts/{yt_id}")
+    click.echo("\nDone!")
 
-            if settings.tiktok_refresh_token:
-                click.echo("  Uploading to TikTok...")
-                from techslop.publish.tiktok import upload_to_tiktok
 
-                pid = upload_to_tiktok(video_path, title)
-                click.echo(f"    TikTok publish_id: {pid}")
+async def _pipeline_main(
+    count: int, upload: bool, encode_workers: int, video_encoder: str
+) -> tuple[list, list]:
+    """Ingest, pick and process stories in one event loop.
 
-            if settings.instagram_access_token:
-                click.echo("  Uploading to Instagram...")
-                from techslop.publish.instagram import upload_to_instagram
+    Everything runs inside one ``shared_client()``, so HTTP connections stay
+    alive across stages and stories. Returns (stories picked, per-story
+    result or exception).
+    """
+    from techslop.db import get_top_new_stories
+    from techslop.httpclient import shared_client
+    from techslop.voice.base import TTSProvider
 
-                mid = upload_to_instagram(video_path, title)
-                click.echo(f"    Instagram media_id: {mid}")
+    async with shared_client():
+        # Provider setup can load models or authenticate; overlap it with
+        # ingest instead of paying for it afterwards. Started inside the
+        # shared-client context so API-backed providers pick up the pool.
+        tts_task = asyncio.create_task(asyncio.to_thread(TTSProvider.from_config, get_settings()))
+        try:
+            click.echo("Ingesting stories...")
+            found, _ = await _ingest_and_store()
+            click.echo(f"  Found {found} stories.")
+
+            top_stories = get_top_new_stories(limit=count)
+            if not top_stories:
+                click.echo("No new stories to process.")
+                return [], []
+
+            tts = await tts_task
+        finally:
+            # Ingest failed or found nothing: stop waiting on the warm-up and
+            # retrieve its outcome so it isn't logged as never retrieved.
+            tts_task.cancel()
+            await asyncio.gather(tts_task, return_exceptions=True)
+
+        results = await _process_all(top_stories, tts, upload, encode_workers, video_encoder)
+    return top_stories, results
+
+
+async def _process_all(
+    stories, tts, upload: bool, encode_workers: int, video_encoder: str
+) -> list:
+    """Process every story concurrently; returns a result or exception per story.
+
+    ffmpeg encodes go to a process pool of ``encode_workers`` so several
+    stories can encode in parallel, each as soon as its inputs are ready.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    settings = get_settings()
+    sem = asyncio.Semaphore(max(1, settings.pipeline_concurrency))
+    # spawn, not fork: this process already has asyncio worker threads.
+    # Workers get the parent's settings up front instead of re-reading .env.
+    with ProcessPoolExecutor(
+        max_workers=max(1, encode_workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=preload_settings,
+        initargs=(settings.model_dump(),),
+    ) as encoder:
+        return await asyncio.gather(
+            *(_process_story(story, tts, sem, encoder, upload, video_encoder) for story in stories),
+            return_exceptions=True,
+        )
 
-            if settings.linkedin_access_token:
-                click.echo("  Uploading to LinkedIn...")
-                from techslop.publish.linkedin import upload_to_linkedin
 
-                pid = upload_to_linkedin(video_path, title, description)
-                click.echo(f"    LinkedIn post: {pid}")
+async def _process_story(
+    story,
+    tts,
+    sem: asyncio.Semaphore,
+    encoder: ProcessPoolExecutor,
+    upload: bool,
+    video_encoder: str,
+) -> Path:
+    """Run script → voice → captions → (motion) → video → (upload) for one story.
+
+    Network-bound steps (OpenAI, TTS, Kling, uploads) run unthrottled; the
+    CPU-bound timestamp/caption steps hold ``sem`` so concurrent stories don't
+    oversubscribe the machine, and the ffmpeg encode runs in ``encoder``.
+    Other blocking calls run via ``asyncio.to_thread``.
+    """
+    from techslop.db import create_video_job, update_job_and_story, update_video_job
+    from techslop.image_gen.grid import generate_grid, grid_shape
+    from techslop.image_gen.split import split_grid
+    from techslop.models import VideoJob
+    from techslop.motion.kling import animate_shots
+    from techslop.scriptgen.generator import generate_script
+    from techslop.video.assembler import assemble_video_motion, assemble_video_static
+    from techslop.video.captions import write_captions
+    from techslop.video.stamps import input_digest, is_fresh, write_stamp
+    from techslop.voice.timestamps import transcribe_words, write_timestamps
 
-            update_video_job(
-                job_id, youtube_id=yt_id, status="published",
-                published_at=datetime.now(timezone.utc),
-            )
-            update_story_status(story.id, "published")
-        else:
-            click.echo(f"  Preview: {video_path}")
-            _open_file(video_path)
+    settings = get_settings()
 
-    click.echo("\nDone!")
+    def echo(msg: str) -> None:
+        click.echo(f"  [{story.id[:12]}] {msg}")
+
+    click.echo(f"\nProcessing: {story.title[:60]}...")
+
+    job = VideoJob(story_id=story.id)
+    job_id = create_video_job(job)
+    paths = StoryPaths.for_story(story.id)
+
+    echo("Generating script...")
+    script_obj = await generate_script(story)
+    _save_script_json(script_obj, paths.script)
+    update_job_and_story(job_id, story.id, script=script_obj, status="scripted")
+
+    echo("Synthesizing voice...")
+    audio_path = paths.audio
+    await tts.synthesize(script_obj.full_text, audio_path)
+    update_video_job(job_id, audio_path=audio_path, status="voiced")
+
+    timestamps_path = paths.timestamps
+    captions_path = paths.captions
+    async with sem:
+        echo("Extracting timestamps...")
+        words = await asyncio.to_thread(transcribe_words, audio_path)
+        # Still saved: the `video` step regenerates captions from this file.
+        # This run captions straight from the in-memory words instead.
+        await asyncio.to_thread(write_timestamps, words, timestamps_path)
+
+        echo("Generating captions...")
+        await asyncio.to_thread(write_captions, words, captions_path)
+
+    motion_clips: list[Path] = []
+    if settings.fal_key:
+        echo("Generating gpt-image-2 grid...")
+        shots_dir = paths.shots
+        shots_dir.mkdir(parents=True, exist_ok=True)
+        grid_path = await asyncio.to_thread(
+            generate_grid,
+            script=script_obj,
+            output_path=shots_dir / "grid.png",
+            character_brief=settings.character_brief,
+            size=settings.image_size,
+        )
+        rows, cols = grid_shape(len(script_obj.body))
+        keyframes = await asyncio.to_thread(
+            split_grid, grid_path, rows=rows, cols=cols, output_dir=shots_dir
+        )
+
+        echo(f"Animating {len(keyframes)} shots via Kling i2v...")
+        motion_prompts = [
+            (s.screen_text or s.text[:60]) + ", subtle cinematic camera motion"
+            for s in script_obj.body[: len(keyframes)]
+        ]
+        motion_clips = await animate_shots(
+            image_paths=keyframes,
+            motion_prompts=motion_prompts,
+            output_dir=shots_dir,
+            duration=settings.motion_duration,
+        )
+
+    video_path = paths.video
+    if motion_clips:
+        video_digest = await asyncio.to_thread(
+            input_digest, "motion", video_encoder, story.title, audio_path, captions_path, *motion_clips
+        )
+        encode = partial(
+            assemble_video_motion,
+            clip_paths=motion_clips,
+            audio_path=audio_path,
+            captions_path=captions_path,
+            output_path=video_path,
+            title=story.title,
+            encoder=video_encoder,
+        )
+    else:
+        bg_path = await asyncio.to_thread(_ensure_background, paths.bg)
+        video_digest = await asyncio.to_thread(
+            input_digest, "static", video_encoder, story.title, audio_path, captions_path, bg_path
+        )
+        # assemble_video_static probes the duration itself, and only if the
+        # video actually needs encoding.
+        encode = partial(
+            assemble_video_static,
+            audio_path=audio_path,
+            captions_path=captions_path,
+            background_path=bg_path,
+            output_path=video_path,
+            title=story.title,
+            encoder=video_encoder,
+        )
+    if await asyncio.to_thread(is_fresh, video_path, video_digest):
+        echo("Inputs unchanged — reusing existing video.")
+    else:
+        echo("Assembling video...")
+        await asyncio.get_running_loop().run_in_executor(encoder, encode)
+        await asyncio.to_thread(write_stamp, video_path, video_digest)
+    update_job_and_story(job_id, story.id, video_path=video_path, status="rendered")
+    echo(f"Video: {video_path}")
+
+    if upload:
+        description = f"{script_obj.hook}\n\nSource: {story.url}\n\n#tech #news #shorts"
+        title = f"{story.title[:90]} #Shorts"
+        tags = ["tech", "news", "shorts", story.source]
+
+        uploads = _upload_calls(
+            video_path, title, description, tags,
+            youtube=bool(settings.youtube_refresh_token),
+            tiktok=bool(settings.tiktok_refresh_token),
+            instagram=bool(settings.instagram_access_token),
+            linkedin=bool(settings.linkedin_access_token),
+        )
+        echo(f"Uploading to {', '.join(uploads) or 'no platforms'}...")
+        results = await _publish_all(uploads)
+        failed = _report_uploads(results, echo)
+        if failed:
+            raise RuntimeError(f"upload failed on {', '.join(failed)}")
+
+        update_job_and_story(
+            job_id, story.id, youtube_id=results.get("YouTube"), status="published",
+            published_at=datetime.now(timezone.utc),
+        )
+    else:
+        echo(f"Preview: {video_path}")
+
+    return video_path
 
 
 if __name__ == "__main__":
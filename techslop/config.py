@@ -8,12 +8,17 @@ Pick which env file to load via the TECHSLOP_ENV var:
 
 This lets the same pipeline drive multiple channels (techslop, swiftbible
 devotionals, etc.) with separate API keys and posting accounts.
+
+Settings are loaded on first use via ``get_settings()`` (``settings`` is kept
+as a lazy alias). Worker processes can be seeded with ``preload_settings()``
+so they skip the env-file parse entirely.
 """
 
 from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings
@@ -26,12 +31,6 @@ def _resolve_env_file() -> str:
     return ".env"
 
 
-_ENV_FILE = _resolve_env_file()
-if Path(_ENV_FILE).exists():
-    # override=True so switching channels mid-shell works as expected
-    load_dotenv(_ENV_FILE, override=True)
-
-
 class Settings(BaseSettings):
     # ── Script generation ────────────────────────────────────────────────
     openai_api_key: str = ""
@@ -45,6 +44,13 @@ class Settings(BaseSettings):
     # Empty = default Chatterbox voice.
     chatterbox_voice_ref: str = ""
 
+    # Whisper model for word timestamps (tiny | base | small | medium | ...).
+    # Loaded once per process and reused for every video.
+    whisper_model: str = "base"
+    # whisper (reference PyTorch) | faster-whisper (CTranslate2, int8 on CPU;
+    # install the fast-whisper extra).
+    whisper_backend: str = "whisper"
+
     # ── Image generation (gpt-image-2 grid) ──────────────────────────────
     image_size: str = "2048x2048"  # gpt-image-2 size
     character_brief: str = ""  # one-line recurring character description
@@ -78,8 +84,20 @@ class Settings(BaseSettings):
 
     # ── Storage ───────────────────────────────────────────────────────────
     database_path: str = "techslop.db"
+    # Story ID hash: blake2b (default) | sha256 (IDs as minted by older installs).
+    story_id_hash: str = "blake2b"
     output_dir: str = "output"
 
+    # ── Pipeline (run / preview) ──────────────────────────────────────────
+    # Max stories whose CPU/ffmpeg-heavy steps run at the same time.
+    pipeline_concurrency: int = 4
+    # Max ffmpeg encodes at once (separate processes; each ffmpeg is itself
+    # multi-threaded, hence a quarter of the cores).
+    encode_concurrency: int = max(1, (os.cpu_count() or 1) // 4)
+    # H.264 encoder: auto (first available of NVENC/QSV/VideoToolbox, else
+    # libx264) | off (always libx264) | an explicit ffmpeg encoder name.
+    hw_encoder: str = "auto"
+
     # ── Source filters ────────────────────────────────────────────────────
     reddit_subreddits: str = (
         "technology,programming,machinelearning,artificial,LocalLLaMA,"
@@ -95,4 +113,34 @@ class Settings(BaseSettings):
     model_config = {"env_file_encoding": "utf-8", "extra": "ignore"}
 
 
-settings = Settings()
+_settings: Settings | None = None
+
+
+def get_settings() -> Settings:
+    """Return the process-wide Settings, loading the env file on first call."""
+    global _settings
+    if _settings is None:
+        env_file = _resolve_env_file()
+        if Path(env_file).exists():
+            # override=True so switching channels mid-shell works as expected
+            load_dotenv(env_file, override=True)
+        _settings = Settings()
+    return _settings
+
+
+def preload_settings(values: dict[str, Any]) -> None:
+    """Install already-validated settings (e.g. a parent's ``model_dump()``).
+
+    Meant as a ``ProcessPoolExecutor`` initializer: the worker reuses the
+    parent's values instead of re-reading the env file and re-validating.
+    """
+    global _settings
+    _settings = Settings.model_construct(**values)
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from techslop.config import settings` working without loading
+    # anything at import time.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,133 +1,404 @@
 from __future__ import annotations
 
-import json
+import atexit
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator
+
+import orjson
 
 from techslop.config import settings
-from techslop.models import Script, ScriptSection, Story, VideoJob
+from techslop.models import Script, ScriptSection, Story, StorySummary, VideoJob
+
+# One long-lived connection per process (reopened if DATABASE_PATH changes),
+# so per-connection state — pragmas, page cache, sqlite3's prepared-statement
+# cache — survives across calls. The pipeline calls in from worker threads,
+# hence check_same_thread=False plus a lock around every use.
+_conn: sqlite3.Connection | None = None
+_conn_path: str | None = None
+_lock = threading.RLock()
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    # Safe under WAL: a crash can lose the last commits, never corrupt the DB.
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    # Upper bound only; SQLite maps no more than the file's actual size.
+    "PRAGMA mmap_size=10737418240",  # 10 GiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
 
 
 def get_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(settings.database_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    return conn
+    """Return the shared connection for ``settings.database_path``.
+
+    Callers must hold ``_lock`` while using it; prefer ``_connection()``.
+    """
+    global _conn, _conn_path
+    with _lock:
+        path = settings.database_path
+        if _conn is None or _conn_path != path:
+            if _conn is not None:
+                _conn.close()
+            # timeout= is SQLite's busy timeout: wait up to 5s for another
+            # writer (e.g. a second CLI run) instead of failing with "locked".
+            conn = sqlite3.connect(
+                path, timeout=5.0, check_same_thread=False, cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            _conn, _conn_path = conn, path
+        return _conn
+
+
+def close_connection() -> None:
+    """Close the shared connection, if open; the next call reopens it.
+
+    Registered with atexit so the last connection out checkpoints the WAL.
+    """
+    global _conn, _conn_path
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = _conn_path = None
+
+
+atexit.register(close_connection)
+
+
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """Hold the lock on the shared connection; roll back if the body raises."""
+    with _lock:
+        conn = get_connection()
+        try:
+            yield conn
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
 
 
 def init_db() -> None:
-    conn = get_connection()
-    conn.executescript(
-        """
-        CREATE TABLE IF NOT EXISTS stories (
-            id TEXT PRIMARY KEY,
-            title TEXT NOT NULL,
-            url TEXT UNIQUE NOT NULL,
-            source TEXT NOT NULL,
-            score REAL,
-            published_at TIMESTAMP,
-            raw_data JSON,
-            status TEXT DEFAULT 'new',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-
-        CREATE TABLE IF NOT EXISTS video_jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            story_id TEXT REFERENCES stories(id),
-            script JSON,
-            audio_path TEXT,
-            video_path TEXT,
-            youtube_id TEXT,
-            status TEXT DEFAULT 'pending',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            published_at TIMESTAMP
-        );
-        """
-    )
-    conn.close()
-
-
-def upsert_story(story: Story) -> None:
-    conn = get_connection()
-    conn.execute(
-        """
-        INSERT INTO stories (id, title, url, source, score, published_at, raw_data, status, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(id) DO UPDATE SET score=excluded.score, raw_data=excluded.raw_data
-        """,
-        (
-            story.id,
-            story.title,
-            story.url,
-            story.source,
-            story.score,
-            story.published_at.isoformat() if story.published_at else None,
-            json.dumps(story.raw_data),
-            story.status,
-            story.created_at.isoformat(),
-        ),
+    with _connection() as conn:
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS stories (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                url TEXT UNIQUE NOT NULL,
+                source TEXT NOT NULL,
+                score REAL,
+                published_at TIMESTAMP,
+                raw_data JSON,
+                status TEXT DEFAULT 'new',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                comment_count INTEGER DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS video_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                story_id TEXT REFERENCES stories(id),
+                script JSON,
+                audio_path TEXT,
+                video_path TEXT,
+                youtube_id TEXT,
+                status TEXT DEFAULT 'pending',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                published_at TIMESTAMP
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_stories_status_source
+                ON stories(status, source, created_at DESC);
+
+            -- get_top_new_stories: status = 'new' ORDER BY score DESC
+            CREATE INDEX IF NOT EXISTS idx_stories_status_score
+                ON stories(status, score DESC);
+
+            -- get_all_stories / unfiltered listings: ORDER BY created_at DESC
+            CREATE INDEX IF NOT EXISTS idx_stories_created_at
+                ON stories(created_at DESC);
+            """
+        )
+        _migrate_comment_count(conn)
+
+
+def _migrate_comment_count(conn: sqlite3.Connection) -> None:
+    """Add and backfill stories.comment_count on databases that predate it."""
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(stories)")}
+    if "comment_count" in columns:
+        return
+    with conn:
+        conn.execute("ALTER TABLE stories ADD COLUMN comment_count INTEGER DEFAULT 0")
+        conn.execute(
+            "UPDATE stories SET comment_count = "
+            "COALESCE(json_array_length(raw_data, '$.comments'), 0)"
+        )
+
+
+# Conflicts are matched on url, not id: rows ingested before story IDs moved
+# from SHA-256 to blake2b keep their original id (and output/ directory).
+_UPSERT_STORY_SQL = """
+    INSERT INTO stories (id, title, url, source, score, published_at, raw_data, status, created_at, comment_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        score=excluded.score, raw_data=excluded.raw_data, comment_count=excluded.comment_count
+"""
+
+
+def _json_default(obj: object) -> object:
+    # Tuple subclasses orjson won't take natively (e.g. struct_time);
+    # stdlib json wrote them as lists.
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: object) -> str:
+    """Serialize a JSON column value with orjson (stored as TEXT).
+
+    Dataclasses such as ``Script`` serialize natively, fields in order.
+    """
+    return orjson.dumps(obj, default=_json_default).decode()
+
+
+def _story_row(story: Story) -> tuple:
+    return (
+        story.id,
+        story.title,
+        story.url,
+        story.source,
+        story.score,
+        story.published_at.isoformat() if story.published_at else None,
+        _dumps(story.raw_data),
+        story.status,
+        story.created_at.isoformat(),
+        len(story.raw_data.get("comments", [])),
     )
-    conn.commit()
-    conn.close()
+
+
+# SQLite's default bound-parameter limit is far above this; it just keeps
+# each id lookup statement a reasonable size.
+_ID_LOOKUP_CHUNK = 500
+
+
+def upsert_story(story: Story) -> str:
+    """Insert or update one story; returns its stored id (see upsert_stories)."""
+    return upsert_stories((story,))[0]
+
+
+def upsert_stories(stories: Iterable[Story]) -> list[str]:
+    """Insert or update many stories in a single transaction (one commit).
+
+    Returns the stored id of each story, in order. It differs from
+    ``story.id`` when the URL was first stored under a legacy SHA-256 id;
+    callers that go on to key jobs or output/ directories on the story must
+    use the returned id.
+    """
+    # Serialize outside the lock so other threads aren't held up by serialization.
+    rows = [_story_row(s) for s in stories]
+    if not rows:
+        return []
+    urls = [row[2] for row in rows]
+    stored: dict[str, str] = {}
+    with _connection() as conn:
+        with conn:
+            conn.executemany(_UPSERT_STORY_SQL, rows)
+            # executemany can't return rows, so read the ids back by URL.
+            for i in range(0, len(urls), _ID_LOOKUP_CHUNK):
+                chunk = urls[i : i + _ID_LOOKUP_CHUNK]
+                stored.update(
+                    conn.execute(
+                        f"SELECT url, id FROM stories WHERE url IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                )
+    return [stored[url] for url in urls]
 
 
 def get_top_new_stories(limit: int = 5) -> list[Story]:
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM stories WHERE status = 'new' ORDER BY score DESC LIMIT ?",
-        (limit,),
-    ).fetchall()
-    conn.close()
+    with _connection() as conn:
+        rows = conn.execute(
+            "SELECT * FROM stories WHERE status = 'new' ORDER BY score DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
     return [_row_to_story(r) for r in rows]
 
 
-def get_all_stories() -> list[Story]:
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM stories ORDER BY created_at DESC"
-    ).fetchall()
-    conn.close()
+def get_all_stories(limit: int | None = None) -> list[Story]:
+    """Newest-first stories, at most ``limit`` of them (all when None)."""
+    with _connection() as conn:
+        # SQLite treats a negative LIMIT as "no limit".
+        rows = conn.execute(
+            "SELECT * FROM stories ORDER BY created_at DESC LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
     return [_row_to_story(r) for r in rows]
 
 
+def _story_filter(status: str | None, source: str | None) -> tuple[str, dict]:
+    """WHERE clause for only the filters given, so SQLite can use their indexes.
+
+    ``(:status IS NULL OR status = :status)`` would cover every case in one
+    statement, but the planner can't search an index with it and scans.
+    """
+    params = {"status": status, "source": source}
+    terms = [f"{col} = :{col}" for col, value in params.items() if value is not None]
+    return ("WHERE " + " AND ".join(terms) if terms else ""), params
+
+
+def get_stories_filtered(
+    status: str | None = None,
+    source: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[Story]:
+    """Newest-first stories matching the optional filters, paged in SQL."""
+    where, params = _story_filter(status, source)
+    with _connection() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM stories {where} ORDER BY created_at DESC LIMIT :limit OFFSET :offset",
+            {**params, "limit": limit, "offset": offset},
+        ).fetchall()
+    return [_row_to_story(r) for r in rows]
+
+
+def get_story_summaries(
+    status: str | None = None,
+    source: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[StorySummary]:
+    """Like get_stories_filtered, but reads only the list-view columns."""
+    where, params = _story_filter(status, source)
+    with _connection() as conn:
+        rows = conn.execute(
+            f"SELECT id, title, url, source, score, status, comment_count FROM stories {where} "
+            "ORDER BY created_at DESC LIMIT :limit OFFSET :offset",
+            {**params, "limit": limit, "offset": offset},
+        ).fetchall()
+    return [
+        StorySummary(
+            id=r["id"],
+            title=r["title"],
+            url=r["url"],
+            source=r["source"],
+            score=r["score"] or 0.0,
+            status=r["status"],
+            comment_count=r["comment_count"] or 0,
+        )
+        for r in rows
+    ]
+
+
+def count_stories(status: str | None = None, source: str | None = None) -> int:
+    where, params = _story_filter(status, source)
+    with _connection() as conn:
+        (count,) = conn.execute(f"SELECT COUNT(*) FROM stories {where}", params).fetchone()
+    return count
+
+
+def _select_by_id_prefix(columns: str, prefix: str, limit: int | None) -> list[sqlite3.Row]:
+    # GLOB rather than LIKE: GLOB is case-sensitive, so SQLite answers it
+    # with a range scan on the primary-key index instead of a table scan.
+    pattern = "".join(f"[{c}]" if c in "*?[" else c for c in prefix) + "*"
+    sql = f"SELECT {columns} FROM stories WHERE id GLOB ? ORDER BY id"
+    params: list = [pattern]
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    with _connection() as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return rows
+
+
+def get_stories_by_id_prefix(prefix: str, limit: int | None = 2) -> list[Story]:
+    """Return stories whose id starts with ``prefix`` (at most ``limit``; None = all)."""
+    return [_row_to_story(r) for r in _select_by_id_prefix("*", prefix, limit)]
+
+
+def get_story_ids_by_prefix(prefix: str, limit: int | None = None) -> list[tuple[str, str]]:
+    """Return ``(id, title)`` pairs for stories whose id starts with ``prefix``.
+
+    Reads only the two columns, so resolving a prefix never touches raw_data.
+    """
+    return [(r["id"], r["title"]) for r in _select_by_id_prefix("id, title", prefix, limit)]
+
+
+def get_story_context(prefix: str, limit: int | None = 2) -> list[dict]:
+    """Display fields for stories whose id starts with ``prefix``, as plain dicts.
+
+    Keys: id, title, source, url, score, status, published_at (ISO string)
+    and raw_data (parsed). Skips building Story objects for commands that
+    only print.
+    """
+    rows = _select_by_id_prefix(
+        "id, title, source, url, score, status, published_at, raw_data", prefix, limit
+    )
+    return [
+        {
+            **dict(r),
+            "score": r["score"] or 0.0,
+            "raw_data": orjson.loads(r["raw_data"]) if r["raw_data"] else {},
+        }
+        for r in rows
+    ]
+
+
+def get_story(story_id: str) -> Story | None:
+    with _connection() as conn:
+        row = conn.execute("SELECT * FROM stories WHERE id = ?", (story_id,)).fetchone()
+    return _row_to_story(row) if row else None
+
+
 def update_story_status(story_id: str, status: str) -> None:
-    conn = get_connection()
-    conn.execute("UPDATE stories SET status = ? WHERE id = ?", (status, story_id))
-    conn.commit()
-    conn.close()
+    with _connection() as conn:
+        conn.execute("UPDATE stories SET status = ? WHERE id = ?", (status, story_id))
+        conn.commit()
 
 
 def create_video_job(job: VideoJob) -> int:
-    conn = get_connection()
-    cursor = conn.execute(
-        """
-        INSERT INTO video_jobs (story_id, script, audio_path, video_path, youtube_id, status)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (
-            job.story_id,
-            json.dumps(_script_to_dict(job.script)) if job.script else None,
-            str(job.audio_path) if job.audio_path else None,
-            str(job.video_path) if job.video_path else None,
-            job.youtube_id,
-            job.status,
-        ),
-    )
-    conn.commit()
-    job_id = cursor.lastrowid
-    conn.close()
+    with _connection() as conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO video_jobs (story_id, script, audio_path, video_path, youtube_id, status)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                job.story_id,
+                _dumps(job.script) if job.script else None,
+                str(job.audio_path) if job.audio_path else None,
+                str(job.video_path) if job.video_path else None,
+                job.youtube_id,
+                job.status,
+            ),
+        )
+        conn.commit()
+        job_id = cursor.lastrowid
     return job_id
 
 
-def update_video_job(job_id: int, **kwargs) -> None:
-    conn = get_connection()
-    sets = []
+@lru_cache(maxsize=64)
+def _update_video_job_sql(columns: tuple[str, ...]) -> str:
+    # One SQL string per column set, so sqlite3's statement cache reuses
+    # the compiled statement instead of re-preparing it on every update.
+    sets = ", ".join(f"{c} = ?" for c in columns)
+    return f"UPDATE video_jobs SET {sets} WHERE id = ?"
+
+
+def _video_job_update(job_id: int, fields: dict) -> tuple[str, list]:
+    """Build a video_jobs UPDATE and its bound values (columns in sorted order)."""
+    columns = tuple(sorted(fields))
     vals = []
-    for k, v in kwargs.items():
-        sets.append(f"{k} = ?")
+    for k in columns:
+        v = fields[k]
         if k == "script" and v is not None:
-            vals.append(json.dumps(_script_to_dict(v)))
+            vals.append(_dumps(v))
         elif isinstance(v, Path):
             vals.append(str(v))
         elif isinstance(v, datetime):
@@ -135,15 +406,31 @@ def update_video_job(job_id: int, **kwargs) -> None:
         else:
             vals.append(v)
     vals.append(job_id)
-    conn.execute(f"UPDATE video_jobs SET {', '.join(sets)} WHERE id = ?", vals)
-    conn.commit()
-    conn.close()
+    return _update_video_job_sql(columns), vals
+
+
+def update_video_job(job_id: int, **kwargs) -> None:
+    sql, vals = _video_job_update(job_id, kwargs)
+    with _connection() as conn:
+        with conn:
+            conn.execute(sql, vals)
+
+
+def update_job_and_story(job_id: int, story_id: str, *, status: str, **fields) -> None:
+    """Set ``status`` on both a video job and its story, plus any extra job fields.
+
+    Both UPDATEs share one transaction (one commit) instead of two.
+    """
+    sql, vals = _video_job_update(job_id, {**fields, "status": status})
+    with _connection() as conn:
+        with conn:
+            conn.execute(sql, vals)
+            conn.execute("UPDATE stories SET status = ? WHERE id = ?", (status, story_id))
 
 
 def get_video_job(job_id: int) -> VideoJob | None:
-    conn = get_connection()
-    row = conn.execute("SELECT * FROM video_jobs WHERE id = ?", (job_id,)).fetchone()
-    conn.close()
+    with _connection() as conn:
+        row = conn.execute("SELECT * FROM video_jobs WHERE id = ?", (job_id,)).fetchone()
     return _row_to_video_job(row) if row else None
 
 
@@ -155,14 +442,14 @@ def _row_to_story(row: sqlite3.Row) -> Story:
         source=row["source"],
         score=row["score"] or 0.0,
         published_at=datetime.fromisoformat(row["published_at"]) if row["published_at"] else datetime.now(timezone.utc),
-        raw_data=json.loads(row["raw_data"]) if row["raw_data"] else {},
+        raw_data=orjson.loads(row["raw_data"]) if row["raw_data"] else {},
         status=row["status"],
         created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(timezone.utc),
     )
 
 
 def _row_to_video_job(row: sqlite3.Row) -> VideoJob:
-    script_data = json.loads(row["script"]) if row["script"] else None
+    script_data = orjson.loads(row["script"]) if row["script"] else None
     script = _dict_to_script(script_data) if script_data else None
     return VideoJob(
         id=row["id"],
@@ -177,16 +464,6 @@ def _row_to_video_job(row: sqlite3.Row) -> VideoJob:
     )
 
 
-def _script_to_dict(script: Script) -> dict:
-    return {
-        "story_id": script.story_id,
-        "hook": script.hook,
-        "body": [{"text": s.text, "screen_text": s.screen_text, "duration_hint": s.duration_hint} for s in script.body],
-        "cta": script.cta,
-        "full_text": script.full_text,
-    }
-
-
 def _dict_to_script(d: dict) -> Script:
     return Script(
         story_id=d["story_id"],
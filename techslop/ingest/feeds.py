@@ -0,0 +1,116 @@
+"""Minimal RSS 2.0 / Atom parsing on lxml for the feed-based sources.
+
+Reddit, TechCrunch and Nitter only need a handful of fields per entry, so this
+reads them straight off the C-backed lxml tree instead of building
+feedparser's full normalized dict for every entry.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+# Summaries end up in raw_data (one SQLite row per story) and in the script
+# prompt; Reddit's HTML bodies can run to many KB, so keep only the head.
+SUMMARY_MAX_CHARS = 1000
+
+# Feeds are untrusted input: never expand entities or touch the network.
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+# Same, but salvaging what it can from broken markup (Nitter instances).
+_RECOVER_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, huge_tree=False, recover=True
+)
+
+
+@dataclass(slots=True)
+class FeedEntry:
+    link: str
+    title: str
+    published_at: datetime | None
+    summary: str = ""
+
+
+def _parse_date(value: str | None, rfc822: bool = False) -> datetime | None:
+    """Parse an ISO 8601 (Atom) or RFC 822 (RSS) timestamp, as UTC if naive.
+
+    The feed's native format is tried first so a well-formed feed never pays
+    for a failed parse; the other format is the fallback for odd feeds.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    parsers = (
+        (parsedate_to_datetime, datetime.fromisoformat)
+        if rfc822
+        else (datetime.fromisoformat, parsedate_to_datetime)
+    )
+    for parse in parsers:
+        try:
+            dt = parse(value)
+        except (TypeError, ValueError):
+            continue
+        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    logger.debug("Unparseable feed date: %r", value)
+    return None
+
+
+def _atom_link(entry: etree._Element) -> str:
+    """Pick the entry's alternate link (Atom allows several ``<link>`` elements)."""
+    for link in entry.iterfind(f"{_ATOM}link"):
+        if link.get("rel", "alternate") == "alternate":
+            return link.get("href", "")
+    return ""
+
+
+def _atom_entries(root: etree._Element) -> list[FeedEntry]:
+    entries = []
+    for entry in root.iterfind(f"{_ATOM}entry"):
+        entries.append(
+            FeedEntry(
+                link=_atom_link(entry),
+                title=(entry.findtext(f"{_ATOM}title") or "").strip(),
+                published_at=_parse_date(
+                    entry.findtext(f"{_ATOM}published") or entry.findtext(f"{_ATOM}updated")
+                ),
+                summary=(
+                    entry.findtext(f"{_ATOM}summary") or entry.findtext(f"{_ATOM}content") or ""
+                )[:SUMMARY_MAX_CHARS],
+            )
+        )
+    return entries
+
+
+def _rss_entries(root: etree._Element) -> list[FeedEntry]:
+    entries = []
+    for item in root.iterfind("channel/item"):
+        entries.append(
+            FeedEntry(
+                link=(item.findtext("link") or "").strip(),
+                title=(item.findtext("title") or "").strip(),
+                published_at=_parse_date(item.findtext("pubDate"), rfc822=True),
+                summary=(item.findtext("description") or "")[:SUMMARY_MAX_CHARS],
+            )
+        )
+    return entries
+
+
+def parse_feed(content: bytes, recover: bool = False) -> list[FeedEntry]:
+    """Parse an RSS 2.0 or Atom document into entries, in feed order.
+
+    Raises ``lxml.etree.XMLSyntaxError`` on malformed XML unless ``recover``
+    is set, in which case whatever parses is returned (possibly nothing).
+    """
+    root = etree.fromstring(content, _RECOVER_PARSER if recover else _PARSER)
+    if root is None:
+        return []
+    if root.tag == f"{_ATOM}feed":
+        return _atom_entries(root)
+    return _rss_entries(root)
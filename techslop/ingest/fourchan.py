@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import heapq
 import logging
 import re
 from datetime import datetime, timezone
 
 import httpx
+import lxml.html
+import orjson
 
 from techslop.config import settings
+from techslop.httpclient import client_session
+from techslop.ingest.ids import story_id
 from techslop.models import Story
 
 logger = logging.getLogger(__name__)
@@ -19,104 +24,148 @@ THREAD_URL = "https://a.4cdn.org/g/thread/{no}.json"
 BOARD_THREAD_URL = "https://boards.4chan.org/g/thread/{no}"
 TOP_N = 20
 TOP_REPLIES = 5
+# Longest reply text kept; the context views print at most this much.
+COMMENT_MAX_CHARS = 500
+# Cap on in-flight thread requests; 4chan rate-limits aggressive clients.
+MAX_CONCURRENT_REQUESTS = 10
 
-_HTML_TAG_RE = re.compile(r"<[^>]+>")
 
+# Characters lxml refuses ("All strings must be XML compatible"), or silently
+# truncates at (lone surrogates). Posts can contain any of them.
+_XML_INCOMPATIBLE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
 
-def _strip_html(text: str) -> str:
-    """Remove HTML tags from a string."""
-    return _HTML_TAG_RE.sub("", text)
 
+def _html_text(html: str) -> str:
+    """Plain text of a 4chan post's HTML, entities decoded, ``<br>`` as newlines."""
+    if not html:
+        return ""
+    root = lxml.html.fragment_fromstring(_XML_INCOMPATIBLE.sub("", html), create_parent="div")
+    for br in root.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+    return root.text_content()
 
-def _thread_matches(thread: dict, keywords: list[str]) -> bool:
-    """Check whether a thread's subject or comment matches any keyword."""
-    subject = _strip_html(thread.get("sub", "")).lower()
-    comment = _strip_html(thread.get("com", "")).lower()
-    combined = f"{subject} {comment}"
 
-    for kw in keywords:
-        if kw in combined:
-            return True
-    return False
+def _trie_regex(node: dict) -> str:
+    if "" in node:
+        # A keyword ends here; any longer one through this node is redundant
+        # for a yes/no search.
+        return ""
+    alts = [re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items())]
+    return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive, prefix-factored alternation.
+
+    ``re`` backtracks through alternatives one by one at every position, so
+    the keywords are merged into a trie first (``p(?:rogramming|ython)``):
+    each position branches once per distinct leading character instead of
+    once per keyword.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword.lower():
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return re.compile(_trie_regex(trie), re.IGNORECASE)
+
+
+def _thread_matches(thread: dict, pattern: re.Pattern[str]) -> bool:
+    """Check whether a thread's subject or comment matches any keyword.
+
+    Searches the raw HTML: 4chan markup is a few fixed tags and class names
+    that tech keywords don't collide with, so stripping every catalog thread
+    first would be wasted work. Only selected threads get ``_html_text``.
+    """
+    return bool(pattern.search(thread.get("sub", "")) or pattern.search(thread.get("com", "")))
 
 
 def _make_title(thread: dict) -> str:
     """Derive a title from the thread subject or comment text."""
-    subject = _strip_html(thread.get("sub", "")).strip()
+    subject = _html_text(thread.get("sub", "")).strip()
     if subject:
         return subject
 
-    comment = _strip_html(thread.get("com", "")).strip()
+    comment = " ".join(_html_text(thread.get("com", "")).split())
     return comment[:100] if comment else "(no subject)"
 
 
 async def _fetch_thread_replies(
-    client: httpx.AsyncClient, thread_no: int
-) -> list[str]:
-    """Fetch the full thread and return the top reply texts (HTML stripped)."""
+    client: httpx.AsyncClient, thread_no: int, limit: asyncio.Semaphore
+) -> list[dict]:
+    """Fetch the full thread and return the top replies as author/text dicts."""
     try:
-        resp = await client.get(THREAD_URL.format(no=thread_no))
+        async with limit:
+            resp = await client.get(THREAD_URL.format(no=thread_no))
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except (httpx.HTTPError, ValueError) as exc:
         logger.warning("Failed to fetch 4chan thread %s: %s", thread_no, exc)
         return []
 
     posts = data.get("posts", [])
     # Skip the OP (index 0) and grab the next TOP_REPLIES posts.
-    replies: list[str] = []
+    replies: list[dict] = []
     for post in posts[1 : TOP_REPLIES + 1]:
-        text = _strip_html(post.get("com", "")).strip()
+        text = _html_text(post.get("com", "")).strip()
         if text:
-            replies.append(text)
+            # Same shape as HN comments, so consumers needn't care about source.
+            replies.append(
+                {"author": post.get("name", "Anonymous"), "text": text[:COMMENT_MAX_CHARS]}
+            )
     return replies
 
 
-async def fetch_fourchan() -> list[Story]:
+async def fetch_fourchan(client: httpx.AsyncClient | None = None) -> list[Story]:
     """Fetch trending threads from /g/ that match configured keywords.
 
+    Uses ``client`` (or the run-wide shared client) when given.
     Returns up to TOP_N Story objects sorted by reply count descending.
     """
-    keywords = [kw.strip().lower() for kw in settings.fourchan_keywords.split(",") if kw.strip()]
+    keywords = [kw.strip() for kw in settings.fourchan_keywords.split(",") if kw.strip()]
     if not keywords:
         logger.warning("No 4chan keywords configured; skipping source")
         return []
+    pattern = _keyword_pattern(keywords)
 
     stories: list[Story] = []
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with client_session(client, timeout=30) as client:
             # Fetch the catalog (all pages of /g/).
             resp = await client.get(CATALOG_URL)
             resp.raise_for_status()
-            catalog: list[dict] = resp.json()
+            catalog: list[dict] = orjson.loads(resp.content)
 
             # Flatten threads from every page and filter by keywords.
             matching: list[dict] = []
             for page in catalog:
                 for thread in page.get("threads", []):
-                    if _thread_matches(thread, keywords):
+                    if _thread_matches(thread, pattern):
                         matching.append(thread)
 
-            # Sort by reply count descending and keep top N.
-            matching.sort(key=lambda t: t.get("replies", 0), reverse=True)
-            matching = matching[:TOP_N]
+            # Keep the top N by reply count, most replies first.
+            matching = heapq.nlargest(TOP_N, matching, key=lambda t: t.get("replies", 0))
 
-            # Build Story objects, fetching top replies for each thread.
-            for thread in matching:
+            # Fetch top replies for every thread concurrently.
+            limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            replies_list = await asyncio.gather(
+                *(_fetch_thread_replies(client, t["no"], limit) for t in matching)
+            )
+
+            # Build Story objects.
+            for thread, replies in zip(matching, replies_list):
                 thread_no: int = thread["no"]
                 thread_url = BOARD_THREAD_URL.format(no=thread_no)
-                story_id = hashlib.sha256(thread_url.encode()).hexdigest()
 
                 published_at = datetime.fromtimestamp(
                     thread.get("time", 0), tz=timezone.utc
                 )
 
-                replies = await _fetch_thread_replies(client, thread_no)
-
                 stories.append(
                     Story(
-                        id=story_id,
+                        id=story_id(thread_url),
                         title=_make_title(thread),
                         url=thread_url,
                         source="4chan",
@@ -125,7 +174,7 @@ async def fetch_fourchan() -> list[Story]:
                         raw_data={
                             "thread_no": thread_no,
                             "subject": thread.get("sub", ""),
-                            "comment": _strip_html(thread.get("com", "")),
+                            "comment": _html_text(thread.get("com", "")),
                             "replies_count": thread.get("replies", 0),
                             "comments": replies,
                         },
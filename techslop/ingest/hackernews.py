@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
 import re
 from datetime import datetime, timezone
 
 import httpx
+import orjson
 
+from techslop.httpclient import client_session
+from techslop.ingest.ids import story_id
 from techslop.models import Story
 
 logger = logging.getLogger(__name__)
@@ -16,14 +19,21 @@ logger = logging.getLogger(__name__)
 HN_BASE = "https://hacker-news.firebaseio.com/v0"
 TOP_N = 30
 TOP_COMMENTS = 5
+# Longest comment text kept; the context views print at most this much.
+COMMENT_MAX_CHARS = 500
+# Cap on in-flight item requests, to stay polite to the Firebase API.
+MAX_CONCURRENT_REQUESTS = 10
 
 
-async def _fetch_item(client: httpx.AsyncClient, item_id: int) -> dict | None:
+async def _fetch_item(
+    client: httpx.AsyncClient, item_id: int, limit: asyncio.Semaphore
+) -> dict | None:
     """Fetch a single HN item by ID, returning None on failure."""
     try:
-        resp = await client.get(f"{HN_BASE}/item/{item_id}.json")
+        async with limit:
+            resp = await client.get(f"{HN_BASE}/item/{item_id}.json")
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
     except (httpx.HTTPError, ValueError) as exc:
         logger.warning("Failed to fetch HN item %s: %s", item_id, exc)
         return None
@@ -34,16 +44,18 @@ def _strip_html(text: str) -> str:
     return re.sub(r"<[^>]+>", "", text)
 
 
-async def _fetch_comments(client: httpx.AsyncClient, item: dict) -> list[dict]:
+async def _fetch_comments(
+    client: httpx.AsyncClient, item: dict, limit: asyncio.Semaphore
+) -> list[dict]:
     """Fetch top comments for an HN story."""
     kid_ids = item.get("kids", [])[:TOP_COMMENTS]
+    fetched = await asyncio.gather(*(_fetch_item(client, kid_id, limit) for kid_id in kid_ids))
     comments = []
-    for kid_id in kid_ids:
-        comment = await _fetch_item(client, kid_id)
+    for comment in fetched:
         if comment and comment.get("text") and not comment.get("deleted"):
             comments.append({
                 "author": comment.get("by", "anon"),
-                "text": _strip_html(comment["text"]),
+                "text": _strip_html(comment["text"])[:COMMENT_MAX_CHARS],
             })
     return comments
 
@@ -58,15 +70,16 @@ def _make_story(item: dict, comments: list[dict] | None = None) -> Story | None:
     if not title:
         return None
 
-    story_id = hashlib.sha256(url.encode()).hexdigest()
     published_at = datetime.fromtimestamp(item.get("time", 0), tz=timezone.utc)
 
-    raw_data = dict(item)
+    # Everything but the child-ID list: it can run to hundreds of ints, is
+    # only needed to fetch comments, and would be stored with every story.
+    raw_data = {k: v for k, v in item.items() if k != "kids"}
     if comments:
         raw_data["comments"] = comments
 
     return Story(
-        id=story_id,
+        id=story_id(url),
         title=title,
         url=url,
         source="hackernews",
@@ -76,27 +89,33 @@ def _make_story(item: dict, comments: list[dict] | None = None) -> Story | None:
     )
 
 
-async def fetch_hackernews() -> list[Story]:
+async def fetch_hackernews(client: httpx.AsyncClient | None = None) -> list[Story]:
     """Fetch the current top stories from Hacker News.
 
+    Uses ``client`` (or the run-wide shared client) when given.
     Returns up to TOP_N Story objects sorted by HN score descending.
     """
     stories: list[Story] = []
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with client_session(client, timeout=30) as client:
             resp = await client.get(f"{HN_BASE}/topstories.json")
             resp.raise_for_status()
-            top_ids: list[int] = resp.json()[:TOP_N]
+            top_ids: list[int] = orjson.loads(resp.content)[:TOP_N]
 
-            for item_id in top_ids:
-                item = await _fetch_item(client, item_id)
+            # The semaphore guards single requests, not whole stories, so a
+            # story waiting on its comments never holds a slot.
+            limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            async def fetch_story(item_id: int) -> Story | None:
+                item = await _fetch_item(client, item_id, limit)
                 if item is None:
-                    continue
-                comments = await _fetch_comments(client, item)
-                story = _make_story(item, comments)
-                if story is not None:
-                    stories.append(story)
+                    return None
+                comments = await _fetch_comments(client, item, limit)
+                return _make_story(item, comments)
+
+            results = await asyncio.gather(*(fetch_story(i) for i in top_ids))
+            stories = [story for story in results if story is not None]
 
     except (httpx.HTTPError, ValueError) as exc:
         logger.error("Hacker News ingestion failed: %s", exc)
@@ -0,0 +1,29 @@
+"""Stable story IDs derived from a story's canonical URL."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Callable
+
+from techslop.config import get_settings
+
+# STORY_ID_HASH -> 32-byte hash constructor. blake2b is faster than SHA-256
+# in CPython; sha256 reproduces the IDs older installs minted, for anything
+# outside the DB (links, output/ directories) keyed on them.
+_HASHES: dict[str, Callable] = {
+    "blake2b": lambda data: hashlib.blake2b(data, digest_size=32),
+    "sha256": hashlib.sha256,
+}
+
+
+def story_id(url: str) -> str:
+    """Return the 64-hex-char ID for ``url``.
+
+    The ID is only a dedup key, not a security boundary. Both hashes give
+    IDs of the same width, and ``upsert_stories`` matches existing rows by
+    URL, so switching ``STORY_ID_HASH`` never duplicates a stored story.
+    """
+    # surrogatepass: a lone surrogate from a malformed feed would otherwise
+    # raise UnicodeEncodeError and drop the whole source's batch.
+    data = url.encode("utf-8", "surrogatepass")
+    return _HASHES[get_settings().story_id_hash](data).hexdigest()
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
 from datetime import datetime, timezone
 
-import feedparser
 import httpx
 
 from techslop.config import settings
+from techslop.httpclient import client_session
+from techslop.ingest.feeds import parse_feed
+from techslop.ingest.ids import story_id
 from techslop.models import Story
 
 logger = logging.getLogger(__name__)
@@ -17,51 +19,41 @@ FEED_URL_TEMPLATE = "https://www.reddit.com/r/{subreddit}/.rss"
 USER_AGENT = "techslop/0.1 (news aggregator)"
 
 
-def _parse_feed(subreddit: str) -> list[Story]:
+async def _parse_feed(client: httpx.AsyncClient, subreddit: str) -> list[Story]:
     """Fetch and parse a single subreddit RSS feed into Story objects."""
     url = FEED_URL_TEMPLATE.format(subreddit=subreddit)
     stories: list[Story] = []
 
     try:
-        # Reddit blocks default feedparser UA, so fetch with httpx first
-        resp = httpx.get(url, headers={"User-Agent": USER_AGENT}, timeout=15, follow_redirects=True)
+        # Reddit blocks generic user agents, so send our own.
+        resp = await client.get(
+            url, headers={"User-Agent": USER_AGENT}, timeout=15, follow_redirects=True
+        )
         resp.raise_for_status()
 
-        feed = feedparser.parse(resp.text)
-        if feed.bozo and not feed.entries:
-            logger.warning(
-                "feedparser reported an error for r/%s: %s",
-                subreddit,
-                feed.bozo_exception,
-            )
-            return stories
-
-        total = len(feed.entries)
-        for rank, entry in enumerate(feed.entries):
-            link = entry.get("link", "")
-            title = entry.get("title", "")
+        entries = parse_feed(resp.content)
+        total = len(entries)
+        # Fallback for undated entries; one value per feed, not per entry.
+        fetched_at = datetime.now(timezone.utc)
+        for rank, entry in enumerate(entries):
+            link = entry.link
+            title = entry.title
             if not link or not title:
                 continue
 
-            story_id = hashlib.sha256(link.encode()).hexdigest()
-
-            time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
-            if time_struct:
-                published_at = datetime(*time_struct[:6], tzinfo=timezone.utc)
-            else:
-                published_at = datetime.now(timezone.utc)
+            published_at = entry.published_at or fetched_at
 
             position_score = float(total - rank)
 
             stories.append(
                 Story(
-                    id=story_id,
+                    id=story_id(link),
                     title=title,
                     url=link,
                     source="reddit",
                     score=position_score,
                     published_at=published_at,
-                    raw_data=dict(entry),
+                    raw_data={"summary": entry.summary} if entry.summary else {},
                 )
             )
 
@@ -71,13 +63,18 @@ def _parse_feed(subreddit: str) -> list[Story]:
     return stories
 
 
-async def fetch_reddit() -> list[Story]:
-    """Fetch stories from all configured subreddit RSS feeds."""
+async def fetch_reddit(client: httpx.AsyncClient | None = None) -> list[Story]:
+    """Fetch stories from all configured subreddit RSS feeds concurrently.
+
+    Uses ``client`` (or the run-wide shared client) when given.
+    """
     all_stories: list[Story] = []
 
     subreddits = [s.strip() for s in settings.reddit_subreddits.split(",")]
-    for subreddit in subreddits:
-        stories = _parse_feed(subreddit)
+    async with client_session(client) as client:
+        results = await asyncio.gather(*(_parse_feed(client, s) for s in subreddits))
+
+    for subreddit, stories in zip(subreddits, results):
         all_stories.extend(stories)
         logger.info("Fetched %d stories from r/%s", len(stories), subreddit)
 
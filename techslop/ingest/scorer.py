@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
 from datetime import datetime, timezone
+from operator import attrgetter
+
+import numpy as np
 
 from techslop.models import Story
 
@@ -23,45 +27,44 @@ RECENCY_HOURS = 6
 RECENCY_BOOST = 0.15
 
 
-def _normalize_scores(stories: list[Story]) -> None:
-    """Normalize raw scores to [0, 1] within each source, in place."""
-    sources: dict[str, list[Story]] = {}
-    for story in stories:
-        sources.setdefault(story.source, []).append(story)
-
-    for source, group in sources.items():
-        scores = [s.score for s in group]
-        min_score = min(scores)
-        max_score = max(scores)
-        span = max_score - min_score
-
-        if span == 0:
-            # All scores identical -- assign 1.0 to every story.
-            for s in group:
-                s.score = 1.0
-        else:
-            for s in group:
-                s.score = (s.score - min_score) / span
+def _compute_scores(stories: list[Story]) -> np.ndarray:
+    """Normalize per source, weight by source, and add the recency boost.
 
+    Each step is a vectorized op over the whole batch rather than a Python
+    loop over stories.
+    """
+    # Compare POSIX timestamps against one cutoff instead of building a
+    # timedelta per story.
+    cutoff = datetime.now(timezone.utc).timestamp() - RECENCY_HOURS * 3600
+    n = len(stories)
+    scores = np.fromiter((s.score for s in stories), dtype=np.float64, count=n)
+    published = np.fromiter((s.published_at.timestamp() for s in stories), dtype=np.float64, count=n)
+    # Integer code per source, in first-seen order: a dict lookup per story
+    # instead of building a string array and sorting it with np.unique.
+    codes: dict[str, int] = {}
+    group = np.fromiter(
+        (codes.setdefault(s.source, len(codes)) for s in stories), dtype=np.intp, count=n
+    )
+    names = list(codes)
 
-def _apply_source_weights(stories: list[Story]) -> None:
-    """Multiply each story's normalized score by its source weight."""
-    for story in stories:
-        weight = SOURCE_WEIGHTS.get(story.source, 0.5)
-        story.score *= weight
+    # Normalize raw scores to [0, 1] within each source: one scatter pass
+    # collects every source's min/max, then a gather broadcasts them back.
+    lo = np.full(len(names), np.inf)
+    hi = np.full(len(names), -np.inf)
+    np.minimum.at(lo, group, scores)
+    np.maximum.at(hi, group, scores)
+    span = (hi - lo)[group]
+    # Sources whose scores are all identical get 1.0 for every story.
+    scores = np.divide(scores - lo[group], span, out=np.ones_like(scores), where=span > 0)
 
-
-def _apply_recency_boost(stories: list[Story]) -> None:
-    """Give a boost to stories published within RECENCY_HOURS."""
-    now = datetime.now(timezone.utc)
-    for story in stories:
-        age_hours = (now - story.published_at).total_seconds() / 3600
-        if age_hours < RECENCY_HOURS:
-            story.score += RECENCY_BOOST
+    weights = np.array([SOURCE_WEIGHTS.get(name, 0.5) for name in names])
+    scores *= weights[group]
+    scores += RECENCY_BOOST * (published > cutoff)
+    return scores
 
 
 def deduplicate(stories: list[Story]) -> list[Story]:
-    """Remove duplicate stories based on their id (SHA-256 of URL).
+    """Remove duplicate stories based on their id (a hash of the URL, see ``ids.story_id``).
 
     When duplicates exist, the copy with the highest score is kept.
     """
@@ -78,20 +81,31 @@ def deduplicate(stories: list[Story]) -> list[Story]:
     return deduped
 
 
-def score_and_rank(stories: list[Story]) -> list[Story]:
+def score_and_rank(stories: list[Story], top_k: int | None = None) -> list[Story]:
     """Full scoring pipeline: normalize, weight, boost, dedup, sort.
 
-    Returns a new list sorted by final score descending.
+    Returns a new list sorted by final score descending -- only the best
+    ``top_k`` when given, selected with a heap instead of a full sort.
     """
     if not stories:
         return []
 
-    _normalize_scores(stories)
-    _apply_source_weights(stories)
-    _apply_recency_boost(stories)
+    # Write scores back and dedup in the same pass (same rule as deduplicate()).
+    best: dict[str, Story] = {}
+    for story, score in zip(stories, _compute_scores(stories).tolist()):
+        story.score = score
+        existing = best.get(story.id)
+        if existing is None or score > existing.score:
+            best[story.id] = story
+
+    removed = len(stories) - len(best)
+    if removed:
+        logger.info("Removed %d duplicate stories", removed)
 
-    unique = deduplicate(stories)
-    unique.sort(key=lambda s: s.score, reverse=True)
+    if top_k is None:
+        unique = sorted(best.values(), key=attrgetter("score"), reverse=True)
+    else:
+        unique = heapq.nlargest(top_k, best.values(), key=attrgetter("score"))
 
     logger.info(
         "Scored and ranked %d stories (top score: %.3f)",
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Callable, Awaitable
+from typing import AsyncIterator, Awaitable, Callable
 
 from techslop.models import Story
 from techslop.ingest.fourchan import fetch_fourchan
@@ -28,12 +28,22 @@ SOURCES: list[tuple[str, SourceFetcher]] = [
 ]
 
 
+# Wall-clock budget per source. Each request already has a 30s timeout, so
+# this caps a source that keeps making slow progress (a crawling Nitter
+# mirror, many slow HN comment fetches) from holding up the whole ingest.
+SOURCE_TIMEOUT = 60.0
+
+
 async def _run_source(name: str, fetcher: SourceFetcher) -> list[Story]:
     """Run a single source fetcher, catching and logging any errors."""
     try:
-        stories = await fetcher()
+        async with asyncio.timeout(SOURCE_TIMEOUT):
+            stories = await fetcher()
         logger.info("Source '%s' returned %d stories", name, len(stories))
         return stories
+    except TimeoutError:
+        logger.error("Source '%s' timed out after %.0fs", name, SOURCE_TIMEOUT)
+        return []
     except Exception as exc:
         logger.error("Source '%s' failed: %s", name, exc)
         return []
@@ -60,3 +70,27 @@ async def ingest_all() -> list[Story]:
     ranked = score_and_rank(all_stories)
     logger.info("Final pipeline produced %d scored stories", len(ranked))
     return ranked
+
+
+async def ingest_stream() -> AsyncIterator[Story]:
+    """Yield scored stories source-by-source as each source finishes.
+
+    Unlike ``ingest_all`` nothing waits for the slowest source: each source's
+    batch is scored as soon as it arrives (normalization is per-source, the
+    weight and recency boost are per-story) and yielded straight away.
+
+    A story already yielded by an earlier source is yielded again only when
+    the later copy scores higher, so upserting every yielded story keeps the
+    best score -- the same result ``deduplicate`` gives ``ingest_all``.
+    """
+    best: dict[str, float] = {}
+    pending = [_run_source(name, fetcher) for name, fetcher in SOURCES]
+    for next_done in asyncio.as_completed(pending):
+        # Scoring is CPU work; run it off the loop so other sources'
+        # fetches keep making progress meanwhile.
+        ranked = await asyncio.to_thread(score_and_rank, await next_done)
+        for story in ranked:
+            seen = best.get(story.id)
+            if seen is None or story.score > seen:
+                best[story.id] = story.score
+                yield story
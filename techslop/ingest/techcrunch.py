@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
 from datetime import datetime, timezone
 
-import feedparser
+import httpx
 
+from techslop.httpclient import client_session
+from techslop.ingest.feeds import parse_feed
+from techslop.ingest.ids import story_id
 from techslop.models import Story
 
 logger = logging.getLogger(__name__)
@@ -15,51 +17,44 @@ logger = logging.getLogger(__name__)
 FEED_URL = "https://techcrunch.com/feed/"
 
 
-async def fetch_techcrunch() -> list[Story]:
+async def fetch_techcrunch(client: httpx.AsyncClient | None = None) -> list[Story]:
     """Fetch the latest stories from the TechCrunch RSS feed.
 
     Stories are scored by position in the feed (same approach as Reddit)
     since the TechCrunch RSS feed is ordered by recency / editorial
-    prominence.
+    prominence. Uses ``client`` (or the run-wide shared client) when given.
     """
     stories: list[Story] = []
 
     try:
-        feed = feedparser.parse(FEED_URL)
-        if feed.bozo and not feed.entries:
-            logger.warning(
-                "feedparser reported an error for TechCrunch: %s",
-                feed.bozo_exception,
-            )
-            return stories
-
-        total = len(feed.entries)
-        for rank, entry in enumerate(feed.entries):
-            link = entry.get("link", "")
-            title = entry.get("title", "")
+        async with client_session(client, timeout=30) as client:
+            resp = await client.get(FEED_URL, follow_redirects=True)
+            resp.raise_for_status()
+
+        entries = parse_feed(resp.content)
+        total = len(entries)
+        # Fallback for undated entries; one value per feed, not per entry.
+        fetched_at = datetime.now(timezone.utc)
+        for rank, entry in enumerate(entries):
+            link = entry.link
+            title = entry.title
             if not link or not title:
                 continue
 
-            story_id = hashlib.sha256(link.encode()).hexdigest()
-
-            time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
-            if time_struct:
-                published_at = datetime(*time_struct[:6], tzinfo=timezone.utc)
-            else:
-                published_at = datetime.now(timezone.utc)
+            published_at = entry.published_at or fetched_at
 
             # Position-based score.
             position_score = float(total - rank)
 
             stories.append(
                 Story(
-                    id=story_id,
+                    id=story_id(link),
                     title=title,
                     url=link,
                     source="techcrunch",
                     score=position_score,
                     published_at=published_at,
-                    raw_data=dict(entry),
+                    raw_data={"summary": entry.summary} if entry.summary else {},
                 )
             )
 
@@ -2,75 +2,105 @@
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
 import urllib.parse
 from datetime import datetime, timezone
 
-import feedparser
 import httpx
 
 from techslop.config import settings
+from techslop.httpclient import client_session
+from techslop.ingest.feeds import FeedEntry, parse_feed
+from techslop.ingest.ids import story_id
 from techslop.models import Story
 
 logger = logging.getLogger(__name__)
 
 NITTER_SEARCH_RSS = "https://nitter.net/search/rss?f=tweets&q={query}"
+# Cap on in-flight keyword searches; public Nitter instances rate-limit hard.
+MAX_CONCURRENT_REQUESTS = 8
+# Longest tweet text kept in raw_data; the context views print at most this much.
+TWEET_MAX_CHARS = 500
 
 
-def _parse_feed_entries(feed: feedparser.FeedParserDict) -> list[Story]:
+def _parse_feed_entries(entries: list[FeedEntry]) -> list[Story]:
     """Convert parsed RSS entries into Story objects.
 
     Stories are scored by position in the feed (first = highest) to
     approximate relevance/recency ranking.
     """
     stories: list[Story] = []
-    total = len(feed.entries)
+    total = len(entries)
+    # Fallback for undated entries; one value per feed, not per entry.
+    fetched_at = datetime.now(timezone.utc)
 
-    for rank, entry in enumerate(feed.entries):
-        link = entry.get("link", "")
-        title = entry.get("title", "")
+    for rank, entry in enumerate(entries):
+        link = entry.link
+        title = entry.title
         if not link:
             continue
 
-        story_id = hashlib.sha256(link.encode()).hexdigest()
-
-        # Prefer the published timestamp; fall back to now.
-        time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
-        if time_struct:
-            published_at = datetime(*time_struct[:6], tzinfo=timezone.utc)
-        else:
-            published_at = datetime.now(timezone.utc)
+        # Prefer the published timestamp; fall back to the fetch time.
+        published_at = entry.published_at or fetched_at
 
         # Position-based score: top of feed = highest.
         position_score = float(total - rank)
 
-        tweet_text = entry.get("summary", title)
+        tweet_text = (entry.summary or title)[:TWEET_MAX_CHARS]
 
         stories.append(
             Story(
-                id=story_id,
-                title=title[:200] if title else link,
+                id=story_id(link),
+                title=(title or link)[:200],
                 url=link,
                 source="x",
                 score=position_score,
                 published_at=published_at,
-                raw_data={
-                    "tweet_text": tweet_text,
-                    "entry": dict(entry),
-                },
+                raw_data={"tweet_text": tweet_text},
             )
         )
 
     return stories
 
 
-async def fetch_x() -> list[Story]:
+async def _fetch_keyword(
+    client: httpx.AsyncClient, keyword: str, limit: asyncio.Semaphore
+) -> list[FeedEntry]:
+    """Fetch and parse one keyword's search RSS; empty on any failure."""
+    try:
+        url = NITTER_SEARCH_RSS.format(query=urllib.parse.quote_plus(keyword))
+        async with limit:
+            resp = await client.get(url, follow_redirects=True)
+        if resp.status_code != 200:
+            logger.warning(
+                "Nitter returned status %d for keyword '%s'; skipping",
+                resp.status_code,
+                keyword,
+            )
+            return []
+
+        # Nitter output is often slightly broken; salvage what parses.
+        entries = parse_feed(resp.content, recover=True)
+        if not entries:
+            logger.warning("No parseable entries for X keyword '%s'", keyword)
+        return entries
+
+    except (httpx.HTTPError, httpx.ConnectError) as exc:
+        logger.warning("Nitter request failed for keyword '%s': %s", keyword, exc)
+    except Exception as exc:
+        logger.warning("Unexpected error fetching X keyword '%s': %s", keyword, exc)
+    return []
+
+
+async def fetch_x(client: httpx.AsyncClient | None = None) -> list[Story]:
     """Fetch tweets matching configured keywords via Nitter RSS.
 
-    Each keyword triggers a separate search-RSS request.  Results are
-    deduplicated by story id across all keyword searches.  All network and
-    parsing failures are caught so this source never crashes the pipeline.
+    Each keyword triggers a separate search-RSS request; the requests run
+    concurrently.  Results are deduplicated by story id across all keyword
+    searches, in keyword order.  All network and parsing failures are
+    caught so this source never crashes the pipeline.
+    Uses ``client`` (or the run-wide shared client) when given.
     """
     keywords = [kw.strip() for kw in settings.x_keywords.split(",") if kw.strip()]
     if not keywords:
@@ -81,53 +111,24 @@ async def fetch_x() -> list[Story]:
     all_stories: list[Story] = []
 
     try:
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            for keyword in keywords:
-                try:
-                    encoded_query = urllib.parse.quote_plus(keyword)
-                    url = NITTER_SEARCH_RSS.format(query=encoded_query)
-
-                    resp = await client.get(url)
-                    if resp.status_code != 200:
-                        logger.warning(
-                            "Nitter returned status %d for keyword '%s'; skipping",
-                            resp.status_code,
-                            keyword,
-                        )
-                        continue
-
-                    feed = feedparser.parse(resp.text)
-                    if feed.bozo and not feed.entries:
-                        logger.warning(
-                            "feedparser error for X keyword '%s': %s",
-                            keyword,
-                            feed.bozo_exception,
-                        )
-                        continue
-
-                    stories = _parse_feed_entries(feed)
-                    for story in stories:
-                        if story.id not in seen_ids:
-                            seen_ids.add(story.id)
-                            all_stories.append(story)
-
-                    logger.debug(
-                        "Keyword '%s' yielded %d tweets (%d new)",
-                        keyword,
-                        len(stories),
-                        sum(1 for s in stories if s.id in seen_ids),
-                    )
-
-                except (httpx.HTTPError, httpx.ConnectError) as exc:
-                    logger.warning(
-                        "Nitter request failed for keyword '%s': %s", keyword, exc
-                    )
-                    continue
-                except Exception as exc:
-                    logger.warning(
-                        "Unexpected error fetching X keyword '%s': %s", keyword, exc
-                    )
-                    continue
+        async with client_session(client, timeout=30) as client:
+            limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            results = await asyncio.gather(
+                *(_fetch_keyword(client, kw, limit) for kw in keywords)
+            )
+
+        for keyword, entries in zip(keywords, results):
+            stories = _parse_feed_entries(entries)
+            new_count = 0
+            for story in stories:
+                if story.id not in seen_ids:
+                    seen_ids.add(story.id)
+                    all_stories.append(story)
+                    new_count += 1
+
+            logger.debug(
+                "Keyword '%s' yielded %d tweets (%d new)", keyword, len(stories), new_count
+            )
 
     except (httpx.HTTPError, httpx.ConnectError) as exc:
         logger.warning("Could not connect to Nitter at all: %s", exc)
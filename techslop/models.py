@@ -5,14 +5,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptSection:
     text: str
     screen_text: str
     duration_hint: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Script:
     story_id: str
     hook: str
@@ -21,7 +21,7 @@ class Script:
     full_text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Story:
     id: str
     title: str
@@ -34,7 +34,20 @@ class Story:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
+class StorySummary:
+    """The columns the story list view needs — no raw_data."""
+
+    id: str
+    title: str
+    url: str
+    source: str
+    score: float
+    status: str
+    comment_count: int = 0
+
+
+@dataclass(slots=True)
 class VideoJob:
     story_id: str
     audio_path: Path | None = None
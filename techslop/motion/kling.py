@@ -15,6 +15,7 @@ import fal_client
 import httpx
 
 from techslop.config import settings
+from techslop.httpclient import client_session
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,7 @@ async def animate_shot(
     output_path: Path,
     duration: str = DEFAULT_DURATION,
     aspect_ratio: str = DEFAULT_ASPECT,
+    client: httpx.AsyncClient | None = None,
 ) -> Path:
     """Animate one keyframe via Kling i2v, write the resulting MP4 to output_path.
 
@@ -45,6 +47,7 @@ async def animate_shot(
         output_path: Where the MP4 lands.
         duration: "5" or "10" seconds.
         aspect_ratio: "9:16" for vertical Shorts.
+        client: HTTP client for the download; defaults to the shared one.
 
     Returns:
         output_path after writing.
@@ -71,8 +74,8 @@ async def animate_shot(
 
     logger.info("Downloading Kling clip → %s", output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        r = await client.get(video_url)
+    async with client_session(client) as client:
+        r = await client.get(video_url, timeout=120.0)
         r.raise_for_status()
         output_path.write_bytes(r.content)
 
@@ -84,6 +87,7 @@ async def animate_shots(
     motion_prompts: list[str],
     output_dir: Path,
     duration: str = DEFAULT_DURATION,
+    client: httpx.AsyncClient | None = None,
 ) -> list[Path]:
     """Animate N shots in parallel. Returns clip paths in input order."""
     if len(image_paths) != len(motion_prompts):
@@ -99,6 +103,7 @@ async def animate_shots(
             motion_prompt=prompt,
             output_path=output_dir / f"clip_{i + 1}.mp4",
             duration=duration,
+            client=client,
         )
         for i, (img, prompt) in enumerate(zip(image_paths, motion_prompts))
     ]
@@ -8,7 +8,15 @@ from googleapiclient.http import MediaFileUpload
 
 from techslop.config import settings
 
-_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MB
+# Files under this size go up in a single request (chunksize=-1); larger
+# ones in big chunks so the TCP window isn't drained between requests.
+# Chunk sizes must be multiples of 256 KiB.
+_SINGLE_REQUEST_MAX = 16 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _upload_chunksize(video_path: Path) -> int:
+    return -1 if video_path.stat().st_size < _SINGLE_REQUEST_MAX else _CHUNK_SIZE
 
 
 def upload_to_youtube(
@@ -59,7 +67,7 @@ def upload_to_youtube(
     media = MediaFileUpload(
         str(video_path),
         resumable=True,
-        chunksize=_CHUNK_SIZE,
+        chunksize=_upload_chunksize(video_path),
     )
 
     request = youtube.videos().insert(
@@ -68,6 +76,7 @@ def upload_to_youtube(
         media_body=media,
     )
 
+    # With chunksize=-1 the first next_chunk() sends the whole file.
     response = None
     while response is None:
         _, response = request.next_chunk()
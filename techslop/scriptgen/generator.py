@@ -5,13 +5,23 @@ from __future__ import annotations
 import json
 import logging
 
+import httpx
 import openai
 
 from techslop.config import settings
+from techslop.httpclient import current_client
 from techslop.models import Script, ScriptSection, Story
 
 logger = logging.getLogger(__name__)
 
+# The SDK already retries 429s and 5xx with exponential backoff; allow a few
+# more attempts since run/preview generate several scripts at once.
+MAX_RETRIES = 5
+
+# Last (http_client, AsyncOpenAI) pair, so concurrent stories in one run share
+# one OpenAI client instead of building a new one per script.
+_openai: tuple[httpx.AsyncClient, openai.AsyncOpenAI] | None = None
+
 SYSTEM_PROMPT = """\
 You are a scriptwriter for a viral tech news YouTube Shorts channel called "TechSlop".
 Your job is to turn a tech news story and its surrounding discussion into a punchy, \
@@ -47,6 +57,14 @@ Respond with JSON in this exact format:
 """
 
 
+def _comment_line(comment: dict | str) -> str:
+    # Ingest stores {"author", "text"} dicts; 4chan rows saved before that
+    # hold bare reply strings.
+    if isinstance(comment, str):
+        return f"  - {comment[:200]}"
+    return f"  - {comment.get('author', 'anon')}: {comment.get('text', '')[:200]}"
+
+
 def _build_context(story: Story) -> str:
     """Build a rich context string from a story and all its gathered data."""
     parts = [
@@ -62,13 +80,7 @@ def _build_context(story: Story) -> str:
     comments = story.raw_data.get("comments", [])
     if comments:
         parts.append("\nCommunity reactions:")
-        for c in comments[:8]:
-            if isinstance(c, dict):
-                author = c.get("author", "anon")
-                text = c.get("text", "")
-                parts.append(f"  - {author}: {text[:200]}")
-            else:
-                parts.append(f"  - {str(c)[:200]}")
+        parts.extend(_comment_line(c) for c in comments[:8])
 
     # X/Twitter tweet text
     if story.raw_data.get("tweet_text"):
@@ -77,13 +89,34 @@ def _build_context(story: Story) -> str:
     return "\n".join(parts)
 
 
-async def generate_script(story: Story) -> Script:
+def _openai_client(http_client: httpx.AsyncClient | None) -> openai.AsyncOpenAI:
+    global _openai
+    if http_client is None:
+        # No pool to share: the SDK creates its own, tied to this event loop.
+        return openai.AsyncOpenAI(api_key=settings.openai_api_key, max_retries=MAX_RETRIES)
+    if _openai is None or _openai[0] is not http_client:
+        _openai = (
+            http_client,
+            openai.AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=http_client,
+                max_retries=MAX_RETRIES,
+                # Keep the SDK's long read timeout; the shared pool's own
+                # timeout would apply otherwise.
+                timeout=openai.DEFAULT_TIMEOUT,
+            ),
+        )
+    return _openai[1]
+
+
+async def generate_script(story: Story, client: httpx.AsyncClient | None = None) -> Script:
     """Generate a YouTube Shorts script from a tech news story with full context.
 
     Feeds all gathered context (comments, discussions, tweet text) to OpenAI
-    for richer, more novel scripts.
+    for richer, more novel scripts. Requests go over ``client`` (or the
+    run-wide shared client) when one is available.
     """
-    client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+    client = _openai_client(client or current_client())
 
     context = _build_context(story)
     user_prompt = (
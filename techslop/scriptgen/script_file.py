@@ -0,0 +1,56 @@
+"""On-disk ``script.json`` format, decoded straight from bytes with msgspec.
+
+The structs mirror ``Script``/``ScriptSection`` but exist only for file I/O:
+msgspec validates and decodes the typed layout in one pass, without an
+intermediate dict. Output stays 2-space indented since people hand-edit it.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import msgspec
+
+from techslop.models import Script, ScriptSection
+
+
+class ScriptSectionFile(msgspec.Struct):
+    text: str
+    screen_text: str
+    duration_hint: float
+
+
+class ScriptFile(msgspec.Struct, kw_only=True):
+    # Hand-crafted files may omit story_id; the caller supplies it then.
+    story_id: str = ""
+    hook: str
+    body: list[ScriptSectionFile]
+    cta: str
+    full_text: str
+
+
+_decoder = msgspec.json.Decoder(ScriptFile)
+_encoder = msgspec.json.Encoder()
+
+
+def load_script(path: Path, story_id: str) -> Script:
+    """Read a script.json, falling back to ``story_id`` when the file has none."""
+    sf = _decoder.decode(path.read_bytes())
+    return Script(
+        story_id=sf.story_id or story_id,
+        hook=sf.hook,
+        body=[ScriptSection(s.text, s.screen_text, s.duration_hint) for s in sf.body],
+        cta=sf.cta,
+        full_text=sf.full_text,
+    )
+
+
+def save_script(script: Script, path: Path) -> None:
+    sf = ScriptFile(
+        story_id=script.story_id,
+        hook=script.hook,
+        body=[ScriptSectionFile(s.text, s.screen_text, s.duration_hint) for s in script.body],
+        cta=script.cta,
+        full_text=script.full_text,
+    )
+    path.write_bytes(msgspec.json.format(_encoder.encode(sf), indent=2))
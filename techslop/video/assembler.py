@@ -8,14 +8,19 @@ Two modes:
   crossfade transitions, syncs to audio, burns captions + watermark + optional
   title overlay. This is the v2 default once you have grid + i2v wired up.
 
-Both output 1080x1920 H.264 MP4 with AAC audio at 30fps.
+Both output 1080x1920 H.264 MP4 with AAC audio at 30fps. H.264 is encoded
+with libx264 unless a hardware encoder (NVENC / VideoToolbox / QSV) is
+selected via ``select_video_encoder``.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import shutil
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -23,74 +28,164 @@ logger = logging.getLogger(__name__)
 CROSSFADE_SECONDS = 0.5
 TARGET_W, TARGET_H = 1080, 1920
 
+SOFTWARE_ENCODER = "libx264"
+# Tried in order when HW_ENCODER=auto.
+HW_ENCODERS = ("h264_videotoolbox", "h264_nvenc", "h264_qsv") if sys.platform == "darwin" else (
+    "h264_nvenc", "h264_qsv"
+)
 
-def get_audio_duration(audio_path: Path) -> float:
-    """Get the duration of an audio file in seconds via ffprobe."""
+# Roughly matched to libx264 -preset medium -crf 23.
+_ENCODER_ARGS = {
+    "libx264": ["-preset", "medium", "-crf", "23"],
+    "h264_nvenc": ["-preset", "p5", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    "h264_qsv": ["-preset", "medium", "-global_quality", "23"],
+    "h264_videotoolbox": ["-b:v", "8M"],
+}
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(path: str, mtime_ns: int, size: int) -> float:
+    # mtime_ns/size are only part of the cache key: a rewritten file probes again.
     result = subprocess.run(
         [
             "ffprobe",
             "-v", "quiet",
             "-print_format", "json",
             "-show_format",
-            str(audio_path),
+            path,
         ],
         capture_output=True,
         text=True,
         check=True,
     )
-    duration = float(json.loads(result.stdout)["format"]["duration"])
+    return float(json.loads(result.stdout)["format"]["duration"])
+
+
+def _media_duration(path: Path) -> float:
+    """Duration in seconds via ffprobe, memoized per (path, mtime, size)."""
+    st = path.stat()
+    return _probe_duration(str(path), st.st_mtime_ns, st.st_size)
+
+
+def get_audio_duration(audio_path: Path) -> float:
+    """Get the duration of an audio file in seconds via ffprobe."""
+    duration = _media_duration(audio_path)
     logger.info("Audio duration for %s: %.2fs", audio_path.name, duration)
     return duration
 
 
 def get_video_duration(video_path: Path) -> float:
     """Get the duration of a video file in seconds via ffprobe."""
+    return _media_duration(video_path)
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_encoders() -> frozenset[str]:
+    """Names of the encoders this ffmpeg build reports (probed once per process)."""
+    if not shutil.which("ffmpeg"):
+        return frozenset()
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True
+    )
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder".
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in "VAS":
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@lru_cache(maxsize=8)
+def _encoder_works(encoder: str) -> bool:
+    """Whether a one-frame test encode with ``encoder`` succeeds.
+
+    ``-encoders`` lists NVENC/QSV whenever ffmpeg was built with them, even
+    on machines without the GPU or driver; only an actual encode tells.
+    """
     result = subprocess.run(
         [
-            "ffprobe",
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_format",
-            str(video_path),
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+            "-frames:v", "1", *_video_codec_args(encoder), "-f", "null", "-",
         ],
         capture_output=True,
         text=True,
-        check=True,
     )
-    return float(json.loads(result.stdout)["format"]["duration"])
+    if result.returncode != 0:
+        logger.info("Encoder %s listed but unusable: %s", encoder, result.stderr.strip()[-200:])
+    return result.returncode == 0
+
 
+def select_video_encoder(hw: str = "auto") -> str:
+    """Resolve an HW_ENCODER setting to an ffmpeg H.264 encoder name.
 
-def _ass_path_filter(captions_path: Path) -> str:
-    """Escape an ASS path for use inside an ffmpeg filtergraph string."""
-    return str(captions_path).replace("\\", "\\\\").replace(":", "\\:")
+    ``auto`` picks the first available hardware encoder, ``off`` forces
+    libx264, and an explicit encoder name is used if ffmpeg has it. Hardware
+    encoders must also pass a test encode. Anything unavailable falls back to
+    libx264.
+    """
+    if hw in ("off", "", SOFTWARE_ENCODER):
+        return SOFTWARE_ENCODER
+    available = _ffmpeg_encoders()
+    if hw == "auto":
+        return next(
+            (e for e in HW_ENCODERS if e in available and _encoder_works(e)), SOFTWARE_ENCODER
+        )
+    if hw in _ENCODER_ARGS and hw in available and _encoder_works(hw):
+        return hw
+    logger.warning("Video encoder %r unavailable; using %s", hw, SOFTWARE_ENCODER)
+    return SOFTWARE_ENCODER
 
 
-def _watermark_filter() -> str:
-    return (
-        "drawtext="
-        "text='techslop':"
-        "fontsize=28:"
-        "fontcolor=white@0.5:"
-        "borderw=1:"
-        "bordercolor=black@0.3:"
-        "x=w-text_w-30:"
-        "y=h-text_h-30"
-    )
+def _video_codec_args(encoder: str) -> list[str]:
+    return ["-c:v", encoder, *_ENCODER_ARGS[encoder]]
+
+
+# Escaping tables for values spliced into filtergraph strings, built once.
+_ASS_PATH_TRANS = str.maketrans({"\\": "\\\\", ":": "\\:"})
+_TITLE_TRANS = str.maketrans({"'": "’", ":": "\\:"})
+
+_WATERMARK_FILTER = (
+    "drawtext="
+    "text='techslop':"
+    "fontsize=28:"
+    "fontcolor=white@0.5:"
+    "borderw=1:"
+    "bordercolor=black@0.3:"
+    "x=w-text_w-30:"
+    "y=h-text_h-30"
+)
+
+_TITLE_FILTER = (
+    "drawtext="
+    "text='{title}':"
+    "fontsize=56:"
+    "fontcolor=white:"
+    "borderw=3:"
+    "bordercolor=black:"
+    "x=(w-text_w)/2:"
+    "y=(h/4)-text_h/2:"
+    "enable='between(t,0,{visible})'"
+)
+
+
+def _ass_filter(captions_path: Path) -> str:
+    """The ``ass=`` filter for a captions file, path escaped for a filtergraph."""
+    return f"ass='{str(captions_path).translate(_ASS_PATH_TRANS)}'"
 
 
 def _title_filter(title: str, duration_visible: float = 2.0) -> str:
-    safe_title = title.replace("'", "’").replace(":", "\\:")
-    return (
-        f"drawtext="
-        f"text='{safe_title}':"
-        f"fontsize=56:"
-        f"fontcolor=white:"
-        f"borderw=3:"
-        f"bordercolor=black:"
-        f"x=(w-text_w)/2:"
-        f"y=(h/4)-text_h/2:"
-        f"enable='between(t,0,{duration_visible})'"
-    )
+    return _TITLE_FILTER.format(title=title.translate(_TITLE_TRANS), visible=duration_visible)
+
+
+def _overlay_filters(captions_path: Path, title: str) -> list[str]:
+    """Captions, optional title, then watermark: the overlays both modes burn in."""
+    filters = [_ass_filter(captions_path)]
+    if title:
+        filters.append(_title_filter(title))
+    filters.append(_WATERMARK_FILTER)
+    return filters
 
 
 # ---------------------------------------------------------------------------
@@ -105,15 +200,16 @@ def assemble_video_static(
     output_path: Path,
     title: str = "",
     duration: float | None = None,
+    encoder: str = SOFTWARE_ENCODER,
 ) -> Path:
-    """Original techslop assembly: loop one image, overlay audio + captions + watermark."""
+    """Original techslop assembly: loop one image, overlay audio + captions + watermark.
+
+    ``encoder`` is an ffmpeg H.264 encoder name, see ``select_video_encoder``.
+    """
     if duration is None:
         duration = get_audio_duration(audio_path)
 
-    filters: list[str] = [f"ass='{_ass_path_filter(captions_path)}'"]
-    if title:
-        filters.append(_title_filter(title))
-    filters.append(_watermark_filter())
+    filters = _overlay_filters(captions_path, title)
 
     cmd = [
         "ffmpeg",
@@ -122,9 +218,7 @@ def assemble_video_static(
         "-i", str(background_path),
         "-i", str(audio_path),
         "-vf", ",".join(filters),
-        "-c:v", "libx264",
-        "-preset", "medium",
-        "-crf", "23",
+        *_video_codec_args(encoder),
         "-r", "30",
         "-s", f"{TARGET_W}x{TARGET_H}",
         "-pix_fmt", "yuv420p",
@@ -135,7 +229,7 @@ def assemble_video_static(
         str(output_path),
     ]
     subprocess.run(cmd, check=True, capture_output=True, text=True)
-    logger.info("Static video assembled: %s (%.1fs)", output_path, duration)
+    logger.info("Static video assembled: %s (%.1fs, %s)", output_path, duration, encoder)
     return output_path
 
 
@@ -189,6 +283,7 @@ def assemble_video_motion(
     output_path: Path,
     title: str = "",
     crossfade: float = CROSSFADE_SECONDS,
+    encoder: str = SOFTWARE_ENCODER,
 ) -> Path:
     """Concatenate motion clips with crossfades, sync to audio, overlay captions.
 
@@ -199,6 +294,7 @@ def assemble_video_motion(
         output_path: Where the final MP4 lands.
         title: Optional title text shown for the first 2 seconds.
         crossfade: Crossfade duration between clips (seconds).
+        encoder: ffmpeg H.264 encoder name, see ``select_video_encoder``.
     """
     if not clip_paths:
         raise ValueError("clip_paths must contain at least one clip")
@@ -211,12 +307,9 @@ def assemble_video_motion(
     )
 
     # Append captions / title / watermark on top of the xfade output
-    overlay_chain = [f"[{final_video_label}]ass='{_ass_path_filter(captions_path)}'"]
-    if title:
-        overlay_chain.append(_title_filter(title))
-    overlay_chain.append(_watermark_filter())
-    overlay_chain.append("[vfinal]")
-    overlay_filter = ",".join(overlay_chain[:-1]) + overlay_chain[-1]
+    overlay_filter = (
+        f"[{final_video_label}]" + ",".join(_overlay_filters(captions_path, title)) + "[vfinal]"
+    )
 
     full_filter = chain_filters + ";" + overlay_filter
 
@@ -229,9 +322,7 @@ def assemble_video_motion(
         "-filter_complex", full_filter,
         "-map", "[vfinal]",
         "-map", f"{len(clip_paths)}:a",
-        "-c:v", "libx264",
-        "-preset", "medium",
-        "-crf", "23",
+        *_video_codec_args(encoder),
         "-r", "30",
         "-pix_fmt", "yuv420p",
         "-c:a", "aac",
@@ -242,8 +333,8 @@ def assemble_video_motion(
     ])
 
     logger.info(
-        "Assembling motion video: %d clips, %.1fs audio, crossfade=%.2fs",
-        len(clip_paths), audio_duration, crossfade,
+        "Assembling motion video: %d clips, %.1fs audio, crossfade=%.2fs, %s",
+        len(clip_paths), audio_duration, crossfade, encoder,
     )
     subprocess.run(cmd, check=True, capture_output=True, text=True)
     logger.info("Motion video assembled: %s", output_path)
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 logger = logging.getLogger(__name__)
@@ -26,8 +32,13 @@ PREFERRED_FONTS = [
 ]
 
 
+@lru_cache(maxsize=32)
 def _get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    """Try to load a preferred bold font, falling back to the default."""
+    """Try to load a preferred bold font, falling back to the default.
+
+    Cached per size: each miss walks the font search path for every
+    preferred name, and the title fitting loop asks for many sizes.
+    """
     for font_name in PREFERRED_FONTS:
         try:
             return ImageFont.truetype(font_name, size)
@@ -40,6 +51,17 @@ def _get_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
+def _gradient_image(width: int, height: int) -> Image.Image:
+    """Vertical GRADIENT_TOP -> GRADIENT_BOTTOM fill, built as one array."""
+    ratios = np.arange(height, dtype=np.float64)[:, None] / height
+    top = np.array(GRADIENT_TOP, dtype=np.float64)
+    bottom = np.array(GRADIENT_BOTTOM, dtype=np.float64)
+    # astype truncates like the int() of the old per-row loop.
+    rows = (top + (bottom - top) * ratios).astype(np.uint8)
+    pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (height, width, 3)))
+    return Image.fromarray(pixels, "RGB")
+
+
 def generate_background(
     output_path: Path, width: int = 1080, height: int = 1920
 ) -> Path:
@@ -53,21 +75,46 @@ def generate_background(
     Returns:
         The output_path after writing the file.
     """
-    image = Image.new("RGB", (width, height))
-    draw = ImageDraw.Draw(image)
-
-    for y in range(height):
-        ratio = y / height
-        r = int(GRADIENT_TOP[0] + (GRADIENT_BOTTOM[0] - GRADIENT_TOP[0]) * ratio)
-        g = int(GRADIENT_TOP[1] + (GRADIENT_BOTTOM[1] - GRADIENT_TOP[1]) * ratio)
-        b = int(GRADIENT_TOP[2] + (GRADIENT_BOTTOM[2] - GRADIENT_TOP[2]) * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    image = _gradient_image(width, height)
 
     image.save(str(output_path), "PNG")
     logger.info("Background image saved to %s (%dx%d)", output_path, width, height)
     return output_path
 
 
+def background_key(width: int = 1080, height: int = 1920) -> str:
+    """Short hash of everything the generated background depends on."""
+    spec = repr((width, height, GRADIENT_TOP, GRADIENT_BOTTOM)).encode()
+    return hashlib.blake2b(spec, digest_size=8).hexdigest()
+
+
+def cached_background(
+    output_path: Path, cache_dir: Path, width: int = 1080, height: int = 1920
+) -> Path:
+    """Copy the background into ``output_path`` from a content-addressed cache.
+
+    The gradient is deterministic, so it is rendered once per distinct
+    (size, colours) into ``cache_dir`` and every later story just copies it.
+    """
+    cached = cache_dir / f"bg_{background_key(width, height)}.png"
+    if not cached.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Render under a per-call temp name so a concurrent reader never sees
+        # a partial PNG and concurrent writers (threads or processes) never
+        # share one; the last rename wins with identical bytes.
+        fd, name = tempfile.mkstemp(dir=cache_dir, prefix=f"{cached.stem}.", suffix=".tmp.png")
+        os.close(fd)
+        tmp = Path(name)
+        try:
+            generate_background(tmp, width, height)
+            tmp.replace(cached)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    shutil.copyfile(cached, output_path)
+    return output_path
+
+
 def generate_title_card(
     title: str, output_path: Path, width: int = 1080, height: int = 1920
 ) -> Path:
@@ -86,16 +133,9 @@ def generate_title_card(
         The output_path after writing the file.
     """
     # Start with a gradient background
-    image = Image.new("RGB", (width, height))
+    image = _gradient_image(width, height)
     draw = ImageDraw.Draw(image)
 
-    for y in range(height):
-        ratio = y / height
-        r = int(GRADIENT_TOP[0] + (GRADIENT_BOTTOM[0] - GRADIENT_TOP[0]) * ratio)
-        g = int(GRADIENT_TOP[1] + (GRADIENT_BOTTOM[1] - GRADIENT_TOP[1]) * ratio)
-        b = int(GRADIENT_TOP[2] + (GRADIENT_BOTTOM[2] - GRADIENT_TOP[2]) * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
     # Determine font size and wrap text to fit
     max_text_width = width - (TITLE_PADDING * 2)
     font_size = 72
@@ -108,14 +148,9 @@ def generate_title_card(
     # Reduce font size if text is too wide
     while font_size > 24:
         font = _get_font(font_size)
-        too_wide = False
-        for line in wrapped_lines:
-            bbox = draw.textbbox((0, 0), line, font=font)
-            line_width = bbox[2] - bbox[0]
-            if line_width > max_text_width:
-                too_wide = True
-                break
-        if not too_wide:
+        # textlength is a plain advance-width sum, cheaper than a full
+        # textbbox layout; stop at the first line that overflows.
+        if all(draw.textlength(line, font=font) <= max_text_width for line in wrapped_lines):
             break
         font_size -= 4
         wrapped_lines = textwrap.wrap(title, width=int(20 * 72 / font_size))
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from itertools import batched
 from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +36,31 @@ HIGHLIGHT_COLOR = "00FFFF"  # Yellow in ASS BGR format (&H00FFFF& = yellow)
 
 def _format_ass_time(seconds: float) -> str:
     """Convert seconds to ASS timestamp format (H:MM:SS.cc)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    centiseconds = int(round((seconds % 1) * 100))
-    return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
+    # Round once to whole centiseconds and split with integer divmod, so a
+    # value like 1.996 carries into the seconds instead of printing ".100".
+    cs = int(seconds * 100 + 0.5)
+    secs, cs = divmod(cs, 100)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{cs:02d}"
+
+
+def load_timestamps(timestamps_path: Path) -> list[dict]:
+    """Read word timestamps from JSON, or from the binary ``.npz`` layout.
+
+    The ``.npz`` form holds three parallel arrays (``word`` as fixed-width
+    unicode, ``start``/``end`` as float32), so loading it does no text
+    parsing and never unpickles anything.
+    """
+    if timestamps_path.suffix == ".npz":
+        with np.load(timestamps_path) as data:
+            return [
+                {"word": word, "start": start, "end": end}
+                for word, start, end in zip(
+                    data["word"].tolist(), data["start"].tolist(), data["end"].tolist()
+                )
+            ]
+    return orjson.loads(timestamps_path.read_bytes())
 
 
 def generate_captions(timestamps_path: Path, output_path: Path) -> Path:
@@ -48,8 +72,9 @@ def generate_captions(timestamps_path: Path, output_path: Path) -> Path:
     Words are grouped into lines of ~4-5 words for readability on vertical video.
 
     Args:
-        timestamps_path: Path to JSON file containing word timestamps.
-            Expected format: [{"word": str, "start": float, "end": float}, ...]
+        timestamps_path: Path to the word timestamps, JSON or ``.npz`` (see
+            ``load_timestamps``). JSON format:
+            [{"word": str, "start": float, "end": float}, ...]
         output_path: Path where the ASS subtitle file will be written.
 
     Returns:
@@ -57,56 +82,44 @@ def generate_captions(timestamps_path: Path, output_path: Path) -> Path:
 
     Raises:
         FileNotFoundError: If timestamps_path does not exist.
-        json.JSONDecodeError: If the timestamps file is not valid JSON.
+        orjson.JSONDecodeError: If the timestamps file is not valid JSON.
         KeyError: If word entries are missing required fields.
     """
-    raw = timestamps_path.read_text()
-    words = json.loads(raw)
+    words = load_timestamps(timestamps_path)
 
     logger.info("Generating captions from %d words", len(words))
+    return write_captions(words, output_path)
 
-    # Group words into lines
-    lines: list[list[dict]] = []
-    for i in range(0, len(words), WORDS_PER_LINE):
-        lines.append(words[i : i + WORDS_PER_LINE])
-
-    # Build ASS dialogue events
-    events: list[str] = []
-    for line_words in lines:
-        if not line_words:
-            continue
-
-        line_start = line_words[0]["start"]
-        line_end = line_words[-1]["end"]
-
-        start_ts = _format_ass_time(line_start)
-        end_ts = _format_ass_time(line_end)
-
-        # Build karaoke text with \kf tags for smooth fill highlighting
-        # \kf duration is in centiseconds
-        karaoke_parts: list[str] = []
-        for word_info in line_words:
-            duration_cs = int(round((word_info["end"] - word_info["start"]) * 100))
-            # Ensure minimum duration of 1 centisecond
-            duration_cs = max(duration_cs, 1)
-            word_text = word_info["word"].strip()
-            karaoke_parts.append(
-                f"{{\\kf{duration_cs}}}{word_text}"
-            )
 
-        karaoke_text = " ".join(karaoke_parts)
+def write_captions(words: Iterable[dict], output_path: Path) -> Path:
+    """Write the ASS captions for already-loaded word timestamps.
 
-        # Apply highlight color as secondary colour override for the karaoke effect
-        styled_text = f"{{\\1c&H{HIGHLIGHT_COLOR}&}}{karaoke_text}"
+    ``words`` is any iterable of ``{"word", "start", "end"}`` dicts, e.g. the
+    list ``transcribe_words`` returns, so a caller that just transcribed the
+    audio can skip the timestamps file round-trip.
+    """
+    # Stream one ASS dialogue event per line of WORDS_PER_LINE words straight
+    # into the file; no joined copy of the whole document is ever built.
+    # UTF-8 explicitly, since libass expects it whatever the locale.
+    n_lines = 0
+    with output_path.open("w", encoding="utf-8", newline="\n") as f:
+        f.write(ASS_HEADER)
+        for line_words in batched(words, WORDS_PER_LINE):
+            start_ts = _format_ass_time(line_words[0]["start"])
+            end_ts = _format_ass_time(line_words[-1]["end"])
+
+            # Karaoke text with \kf tags for smooth fill highlighting; \kf
+            # duration is in centiseconds, with a minimum of 1.
+            karaoke_text = " ".join(
+                f"{{\\kf{max(int(round((w['end'] - w['start']) * 100)), 1)}}}{w['word'].strip()}"
+                for w in line_words
+            )
 
-        event = (
-            f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{styled_text}"
-        )
-        events.append(event)
+            # Apply highlight color as secondary colour override for the karaoke effect
+            styled_text = f"{{\\1c&H{HIGHLIGHT_COLOR}&}}{karaoke_text}"
 
-    # Write the complete ASS file
-    ass_content = ASS_HEADER + "\n".join(events) + "\n"
-    output_path.write_text(ass_content)
+            f.write(f"Dialogue: 0,{start_ts},{end_ts},Default,,0,0,0,,{styled_text}\n")
+            n_lines += 1
 
-    logger.info("Captions written to %s (%d lines)", output_path, len(events))
+    logger.info("Captions written to %s (%d lines)", output_path, n_lines)
     return output_path
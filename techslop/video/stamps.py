@@ -0,0 +1,43 @@
+"""Content-addressed stamps for skipping rebuilds of unchanged render outputs.
+
+Each output (``output.mp4``, ``background.png``, ``captions.ass``) gets a
+sibling ``.stamp`` file holding a hash of everything it was built from. If
+the output exists and the stamp still matches the current inputs, the build
+step can be skipped — e.g. re-running ``video`` after a failed upload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+_READ_CHUNK = 1 << 20
+
+
+def input_digest(*inputs: Path | str | bytes) -> str:
+    """Hash a build's inputs: file contents for Paths, the value otherwise."""
+    h = hashlib.blake2b(digest_size=16)
+    for item in inputs:
+        if isinstance(item, Path):
+            with item.open("rb") as f:
+                while chunk := f.read(_READ_CHUNK):
+                    h.update(chunk)
+        else:
+            h.update(item.encode() if isinstance(item, str) else item)
+        # Separator so ("ab", "c") and ("a", "bc") hash differently.
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def stamp_path(output: Path) -> Path:
+    return output.with_suffix(".stamp")
+
+
+def is_fresh(output: Path, digest: str) -> bool:
+    """True if ``output`` exists and was last built from inputs hashing to ``digest``."""
+    stamp = stamp_path(output)
+    return output.exists() and stamp.exists() and stamp.read_text() == digest
+
+
+def write_stamp(output: Path, digest: str) -> None:
+    stamp_path(output).write_text(digest)
@@ -1,7 +1,8 @@
 from pathlib import Path
 
-from openai import AsyncOpenAI
+from openai import DEFAULT_TIMEOUT, AsyncOpenAI
 
+from techslop.httpclient import current_client
 from techslop.voice.base import TTSProvider
 
 
@@ -11,7 +12,13 @@ class OpenAITTS(TTSProvider):
 
     def __init__(self, config):
         self.config = config
-        self.client = AsyncOpenAI(api_key=config.openai_api_key)
+        # A custom http_client's timeout would otherwise replace the SDK's
+        # long read timeout with the shared pool's short one.
+        self.client = AsyncOpenAI(
+            api_key=config.openai_api_key,
+            http_client=current_client(),
+            timeout=DEFAULT_TIMEOUT,
+        )
 
     async def synthesize_chunk(self, text: str, output_path: Path) -> Path:
         response = await self.client.audio.speech.create(
@@ -1,23 +1,101 @@
-import json
+"""Word-level timestamps for captions, from Whisper or faster-whisper."""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+import orjson
 import whisper
 
+from techslop.config import get_settings
 
-def extract_timestamps(audio_path: Path, output_path: Path) -> Path:
-    model = whisper.load_model("base")
-    result = model.transcribe(str(audio_path), word_timestamps=True)
-
-    words = []
-    for segment in result["segments"]:
-        for word_info in segment.get("words", []):
-            words.append(
-                {
-                    "word": word_info["word"],
-                    "start": word_info["start"],
-                    "end": word_info["end"],
-                }
-            )
-
-    output_path.write_text(json.dumps(words, indent=2))
+# Whisper installs per-call kv-cache hooks on the shared model, so
+# transcriptions from concurrent pipeline threads must not overlap.
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=2)
+def _get_model(name: str) -> whisper.Whisper:
+    """Load a Whisper model once per process instead of once per video."""
+    return whisper.load_model(name)
+
+
+@lru_cache(maxsize=2)
+def _get_faster_model(name: str):
+    """Load a faster-whisper (CTranslate2) model once per process.
+
+    Needs the ``fast-whisper`` extra. ``auto`` picks CUDA when present and the
+    fastest compute type the device supports (int8 on most CPUs).
+    """
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(name, device="auto", compute_type="auto")
+
+
+def _whisper_words(audio_path: Path, model_name: str) -> list[dict]:
+    with _model_lock:
+        model = _get_model(model_name)
+        # fp16 only on CUDA; on CPU Whisper would warn and fall back anyway.
+        result = model.transcribe(
+            str(audio_path), word_timestamps=True, fp16=model.device.type == "cuda"
+        )
+    return [
+        {"word": w["word"], "start": w["start"], "end": w["end"]}
+        for segment in result["segments"]
+        for w in segment.get("words", ())
+    ]
+
+
+def _faster_whisper_words(audio_path: Path, model_name: str) -> list[dict]:
+    with _model_lock:
+        model = _get_faster_model(model_name)
+        # Segments are decoded lazily, so consume them while holding the lock.
+        segments, _ = model.transcribe(str(audio_path), word_timestamps=True)
+        return [
+            {"word": w.word, "start": w.start, "end": w.end}
+            for segment in segments
+            for w in segment.words or ()
+        ]
+
+
+_BACKENDS = {
+    "whisper": _whisper_words,
+    "faster-whisper": _faster_whisper_words,
+}
+
+
+def transcribe_words(audio_path: Path) -> list[dict]:
+    """Word-level ``{"word", "start", "end"}`` timings for ``audio_path``."""
+    settings = get_settings()
+    name = settings.whisper_backend
+    try:
+        backend = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown whisper_backend {name!r}; expected one of {sorted(_BACKENDS)}"
+        ) from None
+    return backend(audio_path, settings.whisper_model)
+
+
+def write_timestamps(words: list[dict], output_path: Path) -> Path:
+    if output_path.suffix == ".npz":
+        # Binary parallel arrays; float32 is ample for centisecond captions.
+        np.savez(
+            output_path,
+            word=np.array([w["word"] for w in words], dtype=np.str_),
+            start=np.array([w["start"] for w in words], dtype=np.float32),
+            end=np.array([w["end"] for w in words], dtype=np.float32),
+        )
+        return output_path
+
+    # Compact bytes straight from orjson; read back by generate_captions.
+    # SERIALIZE_NUMPY covers any numpy float32 timings Whisper hands back.
+    output_path.write_bytes(orjson.dumps(words, option=orjson.OPT_SERIALIZE_NUMPY))
     return output_path
+
+
+def extract_timestamps(audio_path: Path, output_path: Path) -> Path:
+    return write_timestamps(transcribe_words(audio_path), output_path)
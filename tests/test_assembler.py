@@ -0,0 +1,58 @@
+"""Tests for techslop.video.assembler encoder selection and filter building."""
+
+from pathlib import Path
+
+from techslop.video import assembler
+
+
+def test_select_video_encoder(monkeypatch):
+    monkeypatch.setattr(assembler, "_ffmpeg_encoders", lambda: frozenset({"libx264", "h264_qsv"}))
+    monkeypatch.setattr(assembler, "HW_ENCODERS", ("h264_nvenc", "h264_qsv"))
+    monkeypatch.setattr(assembler, "_encoder_works", lambda e: True)
+
+    assert assembler.select_video_encoder("auto") == "h264_qsv"
+    assert assembler.select_video_encoder("off") == "libx264"
+    assert assembler.select_video_encoder("h264_qsv") == "h264_qsv"
+    assert assembler.select_video_encoder("h264_nvenc") == "libx264"
+
+
+def test_select_video_encoder_skips_listed_but_broken(monkeypatch):
+    encoders = frozenset({"libx264", "h264_nvenc", "h264_qsv"})
+    monkeypatch.setattr(assembler, "_ffmpeg_encoders", lambda: encoders)
+    monkeypatch.setattr(assembler, "HW_ENCODERS", ("h264_nvenc", "h264_qsv"))
+    monkeypatch.setattr(assembler, "_encoder_works", lambda e: e != "h264_nvenc")
+
+    assert assembler.select_video_encoder("auto") == "h264_qsv"
+    assert assembler.select_video_encoder("h264_nvenc") == "libx264"
+
+
+def test_video_codec_args():
+    assert assembler._video_codec_args("libx264") == ["-c:v", "libx264", "-preset", "medium", "-crf", "23"]
+
+
+def test_overlay_filters_escape_path_and_title():
+    filters = assembler._overlay_filters(Path("C:\\out\\captions.ass"), "Rust's future: 2.0")
+    assert filters[0] == "ass='C\\:\\\\out\\\\captions.ass'"
+    assert "text='Rust’s future\\: 2.0'" in filters[1]
+    assert filters[2].startswith("drawtext=text='techslop'")
+    assert len(assembler._overlay_filters(Path("c.ass"), "")) == 2
+
+
+def test_media_duration_probes_once_per_file_version(tmp_path, monkeypatch):
+    calls = []
+
+    class Result:
+        stdout = '{"format": {"duration": "12.5"}}'
+
+    monkeypatch.setattr(assembler.subprocess, "run", lambda cmd, **kw: calls.append(cmd) or Result())
+    assembler._probe_duration.cache_clear()
+
+    audio = tmp_path / "narration.mp3"
+    audio.write_bytes(b"a")
+    assert assembler.get_audio_duration(audio) == 12.5
+    assert assembler.get_audio_duration(audio) == 12.5
+    assert len(calls) == 1
+
+    audio.write_bytes(b"longer")
+    assembler.get_audio_duration(audio)
+    assert len(calls) == 2
@@ -0,0 +1,46 @@
+"""Tests for techslop.video.assets background caching."""
+
+from techslop.video import assets
+
+
+def test_cached_background_renders_once(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    calls = []
+    real = assets.generate_background
+    monkeypatch.setattr(
+        assets, "generate_background", lambda p, w, h: calls.append(p) or real(p, w, h)
+    )
+
+    a = assets.cached_background(tmp_path / "a.png", cache, 108, 192)
+    b = assets.cached_background(tmp_path / "b.png", cache, 108, 192)
+
+    assert len(calls) == 1
+    assert a.read_bytes() == b.read_bytes()
+    assert [p.name for p in cache.iterdir()] == [f"bg_{assets.background_key(108, 192)}.png"]
+
+
+def test_cached_background_concurrent_cold_cache(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import Barrier
+
+    cache = tmp_path / "cache"
+    barrier = Barrier(4)
+    real = assets.generate_background
+
+    def racing(p, w, h):
+        # Every thread misses the cache, and finishes rendering, before any
+        # of them renames its file into place.
+        barrier.wait()
+        real(p, w, h)
+        barrier.wait()
+        return p
+
+    monkeypatch.setattr(assets, "generate_background", racing)
+
+    with ThreadPoolExecutor(4) as pool:
+        outs = list(pool.map(
+            lambda i: assets.cached_background(tmp_path / f"{i}.png", cache, 108, 192), range(4)
+        ))
+
+    assert len({p.read_bytes() for p in outs}) == 1
+    assert [p.name for p in cache.iterdir()] == [f"bg_{assets.background_key(108, 192)}.png"]
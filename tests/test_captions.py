@@ -3,7 +3,14 @@
 import json
 from pathlib import Path
 
-from techslop.video.captions import generate_captions
+import numpy as np
+
+from techslop.video.captions import (
+    _format_ass_time,
+    generate_captions,
+    load_timestamps,
+    write_captions,
+)
 
 
 def test_generate_captions(tmp_path):
@@ -33,3 +40,48 @@ def test_generate_captions(tmp_path):
     assert "[Events]" in content
     # Should have dialogue lines
     assert "Dialogue:" in content
+
+
+def test_format_ass_time_carries_rounded_centiseconds():
+    assert _format_ass_time(0.0) == "0:00:00.00"
+    assert _format_ass_time(61.25) == "0:01:01.25"
+    assert _format_ass_time(3725.5) == "1:02:05.50"
+    assert _format_ass_time(1.996) == "0:00:02.00"
+    assert _format_ass_time(59.999) == "0:01:00.00"
+
+
+def test_npz_timestamps_render_like_json(tmp_path):
+    words = [
+        {"word": " Héllo", "start": 0.0, "end": 0.5},
+        {"word": " world", "start": 0.5, "end": 1.3},
+        {"word": " again", "start": 1.3, "end": 2.0},
+    ]
+    json_path = tmp_path / "timestamps.json"
+    json_path.write_text(json.dumps(words))
+    npz_path = tmp_path / "timestamps.npz"
+    np.savez(
+        npz_path,
+        word=np.array([w["word"] for w in words], dtype=np.str_),
+        start=np.array([w["start"] for w in words], dtype=np.float32),
+        end=np.array([w["end"] for w in words], dtype=np.float32),
+    )
+
+    loaded = load_timestamps(npz_path)
+    assert [w["word"] for w in loaded] == [w["word"] for w in words]
+    assert all(isinstance(w["start"], float) for w in loaded)
+
+    generate_captions(json_path, tmp_path / "a.ass")
+    generate_captions(npz_path, tmp_path / "b.ass")
+    assert (tmp_path / "a.ass").read_bytes() == (tmp_path / "b.ass").read_bytes()
+
+
+def test_write_captions_from_words_matches_file_path(tmp_path):
+    words = [{"word": f" w{i}", "start": i * 0.4, "end": i * 0.4 + 0.35} for i in range(12)]
+    ts_path = tmp_path / "timestamps.json"
+    ts_path.write_text(json.dumps(words))
+
+    generate_captions(ts_path, tmp_path / "from_file.ass")
+    # Any iterable works, not just a list.
+    write_captions(iter(words), tmp_path / "from_words.ass")
+
+    assert (tmp_path / "from_file.ass").read_bytes() == (tmp_path / "from_words.ass").read_bytes()
@@ -6,6 +6,8 @@ from techslop.config import Settings
 def test_defaults():
     s = Settings(openai_api_key="test")
     assert s.tts_provider == "edge"
+    assert s.whisper_model == "base"
+    assert s.whisper_backend == "whisper"
     assert s.database_path == "techslop.db"
     assert s.output_dir == "output"
 
@@ -20,3 +22,12 @@ def test_fourchan_keywords_parsing():
     s = Settings(fourchan_keywords="AI,LLM,GPU")
     kw = [x.strip() for x in s.fourchan_keywords.split(",")]
     assert kw == ["AI", "LLM", "GPU"]
+
+
+def test_preload_settings_seeds_get_settings(monkeypatch):
+    from techslop import config
+
+    monkeypatch.setattr(config, "_settings", None)
+    config.preload_settings(Settings(output_dir="elsewhere").model_dump())
+    assert config.get_settings().output_dir == "elsewhere"
+    assert config.settings is config.get_settings()
@@ -1,4 +1,4 @@
-"""Tests for techslop.db — uses a temp database."""
+"""Tests for techslop.db — uses a fresh in-memory database per test."""
 
 import os
 from datetime import datetime, timezone
@@ -9,10 +9,25 @@ from techslop.models import Script, ScriptSection, Story, VideoJob
 
 
 @pytest.fixture(autouse=True)
-def _tmp_db(tmp_path, monkeypatch):
-    """Point the database at a temp file for each test."""
-    db_path = str(tmp_path / "test.db")
-    monkeypatch.setattr("techslop.config.settings.database_path", db_path)
+def _tmp_db(monkeypatch):
+    """Give each test its own in-memory database (no file or fsync I/O).
+
+    The shared connection is keyed on the path, and every test uses the same
+    ``:memory:`` path, so close it on both sides to get a fresh database.
+    """
+    from techslop.db import close_connection, init_db
+
+    monkeypatch.setattr("techslop.config.settings.database_path", ":memory:")
+    close_connection()
+    init_db()
+    yield
+    close_connection()
+
+
+@pytest.fixture
+def file_db(tmp_path, monkeypatch):
+    """A temp-file database, for tests of WAL or reopening the connection."""
+    monkeypatch.setattr("techslop.config.settings.database_path", str(tmp_path / "test.db"))
     from techslop.db import init_db
     init_db()
 
@@ -54,6 +69,21 @@ def test_upsert_updates_score():
     assert stories[0].score == 99.0
 
 
+def test_upsert_keeps_legacy_id_for_known_url():
+    """Re-ingesting a URL stored under an old-style id updates that row."""
+    from techslop.db import get_all_stories, upsert_story
+
+    legacy = _make_story("1", score=10.0)
+    upsert_story(legacy)
+
+    rehashed = _make_story("1", score=30.0)
+    rehashed.id = "new_style_id"
+    assert upsert_story(rehashed) == "story_1"
+
+    stories = get_all_stories()
+    assert [(s.id, s.score) for s in stories] == [("story_1", 30.0)]
+
+
 def test_get_top_new_stories():
     from techslop.db import get_top_new_stories, upsert_story
 
@@ -97,6 +127,7 @@ def test_create_and_get_video_job():
     assert loaded.story_id == s.id
     assert loaded.script.hook == "Hook!"
     assert len(loaded.script.body) == 1
+    assert loaded.script == script
 
 
 def test_update_video_job():
@@ -113,3 +144,298 @@ def test_update_video_job():
     loaded = get_video_job(job_id)
     assert loaded.status == "rendered"
     assert loaded.youtube_id == "yt_abc123"
+
+
+def test_upsert_stories_batch():
+    from techslop.db import get_all_stories, upsert_stories
+
+    upsert_stories([_make_story(str(i), score=float(i)) for i in range(5)])
+
+    again = _make_story("0", score=42.0)
+    upsert_stories([again])
+
+    stories = {s.id: s for s in get_all_stories()}
+    assert len(stories) == 5
+    assert stories["story_0"].score == 42.0
+
+
+def test_update_job_and_story():
+    from techslop.db import (
+        create_video_job,
+        get_all_stories,
+        get_video_job,
+        update_job_and_story,
+        upsert_story,
+    )
+
+    s = _make_story("1")
+    upsert_story(s)
+    job_id = create_video_job(VideoJob(story_id=s.id))
+
+    update_job_and_story(job_id, s.id, status="rendered", youtube_id="yt_abc123")
+
+    loaded = get_video_job(job_id)
+    assert loaded.status == "rendered"
+    assert loaded.youtube_id == "yt_abc123"
+    assert get_all_stories()[0].status == "rendered"
+
+
+def test_get_stories_by_id_prefix():
+    from techslop.db import get_stories_by_id_prefix, upsert_story
+
+    for suffix in ("abc1", "abc2", "xyz"):
+        upsert_story(_make_story(suffix))
+
+    assert [s.id for s in get_stories_by_id_prefix("story_x")] == ["story_xyz"]
+    assert len(get_stories_by_id_prefix("story_abc", limit=2)) == 2
+    assert len(get_stories_by_id_prefix("story_", limit=None)) == 3
+    assert get_stories_by_id_prefix("STORY_") == []
+    assert get_stories_by_id_prefix("story_*") == []
+
+
+def test_get_stories_filtered_and_count():
+    from dataclasses import replace
+
+    from techslop.db import count_stories, get_stories_filtered, upsert_stories
+
+    upsert_stories([
+        _make_story("1"),
+        _make_story("2"),
+        replace(_make_story("3"), source="reddit"),
+    ])
+
+    assert len(get_stories_filtered(limit=2)) == 2
+    assert [s.id for s in get_stories_filtered(source="reddit")] == ["story_3"]
+    assert get_stories_filtered(status="published") == []
+    assert count_stories() == 3
+    assert count_stories(source="hackernews", status="new") == 2
+
+
+def test_story_summaries_carry_comment_count():
+    from dataclasses import replace
+
+    from techslop.db import get_story_summaries, upsert_story
+
+    upsert_story(replace(_make_story("1"), raw_data={"comments": ["a", "b", "c"]}))
+    upsert_story(_make_story("2"))
+
+    counts = {s.id: s.comment_count for s in get_story_summaries()}
+    assert counts == {"story_1": 3, "story_2": 0}
+
+
+def test_init_db_backfills_comment_count(tmp_path, monkeypatch):
+    import sqlite3
+
+    from techslop.db import get_story_summaries, init_db
+
+    db_path = str(tmp_path / "old.db")
+    monkeypatch.setattr("techslop.config.settings.database_path", db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE stories (id TEXT PRIMARY KEY, title TEXT NOT NULL, url TEXT UNIQUE NOT NULL, "
+        "source TEXT NOT NULL, score REAL, published_at TIMESTAMP, raw_data JSON, "
+        "status TEXT DEFAULT 'new', created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO stories (id, title, url, source, raw_data) VALUES (?, ?, ?, ?, ?)",
+        ("old", "Old", "https://example.com/old", "hackernews", '{"comments": [1, 2]}'),
+    )
+    conn.commit()
+    conn.close()
+
+    init_db()
+    assert get_story_summaries()[0].comment_count == 2
+
+
+def test_get_story_ids_by_prefix_and_get_story():
+    from techslop.db import get_story, get_story_ids_by_prefix, upsert_story
+
+    upsert_story(_make_story("abc1", title="First"))
+    upsert_story(_make_story("abc2", title="Second"))
+
+    assert get_story_ids_by_prefix("story_abc") == [("story_abc1", "First"), ("story_abc2", "Second")]
+    assert get_story_ids_by_prefix("story_abc", limit=1) == [("story_abc1", "First")]
+    assert get_story("story_abc2").title == "Second"
+    assert get_story("missing") is None
+
+
+def test_connection_is_reused_with_pragmas(file_db):
+    from techslop.db import get_connection
+
+    conn = get_connection()
+    assert get_connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_get_story_context():
+    from dataclasses import replace
+
+    from techslop.db import get_story_context, upsert_story
+
+    upsert_story(replace(_make_story("ctx1"), raw_data={"summary": "S"}))
+    upsert_story(_make_story("ctx2"))
+
+    (ctx,) = get_story_context("story_ctx1")
+    assert ctx["title"] == "Test Story"
+    assert ctx["raw_data"] == {"summary": "S"}
+    assert len(get_story_context("story_ctx")) == 2
+
+
+def test_close_connection_reopens_on_next_use(file_db):
+    from techslop.db import close_connection, get_connection, upsert_story
+
+    first = get_connection()
+    close_connection()
+    upsert_story(_make_story("after_close"))
+    assert get_connection() is not first
+
+
+def test_top_new_stories_uses_status_score_index():
+    from techslop.db import get_connection
+
+    plan = get_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM stories WHERE status = 'new' ORDER BY score DESC LIMIT 5"
+    ).fetchall()
+    detail = " ".join(row["detail"] for row in plan)
+    assert "idx_stories_status_score" in detail
+    assert "TEMP B-TREE" not in detail
+
+
+def test_filtered_listings_search_status_indexes():
+    from techslop.db import _story_filter, get_connection
+
+    def plan(status, source):
+        where, params = _story_filter(status, source)
+        rows = get_connection().execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM stories {where} ORDER BY created_at DESC LIMIT 20",
+            params,
+        ).fetchall()
+        return " ".join(row["detail"] for row in rows)
+
+    both = plan("new", "hackernews")
+    assert "idx_stories_status_source" in both
+    assert "TEMP B-TREE" not in both
+    assert "SEARCH stories USING INDEX idx_stories_status" in plan("new", None)
+    assert "idx_stories_created_at" in plan(None, None)
+
+
+def test_get_all_stories_walks_created_at_index():
+    from techslop.db import get_all_stories, get_connection, upsert_stories
+
+    upsert_stories([_make_story(str(i)) for i in range(4)])
+    assert len(get_all_stories(limit=2)) == 2
+    assert len(get_all_stories()) == 4
+
+    plan = get_connection().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM stories ORDER BY created_at DESC LIMIT 2"
+    ).fetchall()
+    detail = " ".join(row["detail"] for row in plan)
+    assert "idx_stories_created_at" in detail
+    assert "TEMP B-TREE" not in detail
+
+
+def test_raw_data_round_trips_tuples_and_unicode():
+    import time
+
+    from techslop.db import get_story, upsert_story
+
+    s = _make_story("1")
+    s.raw_data = {"entry": {"published_parsed": time.gmtime(0)}, "text": "naïve — ✓"}
+    upsert_story(s)
+
+    loaded = get_story(s.id)
+    assert loaded.raw_data["entry"]["published_parsed"][:3] == [1970, 1, 1]
+    assert loaded.raw_data["text"] == "naïve — ✓"
+
+
+def test_update_video_job_reuses_sql_per_column_set():
+    from techslop.db import (
+        _update_video_job_sql,
+        create_video_job,
+        get_video_job,
+        update_video_job,
+        upsert_story,
+    )
+
+    upsert_story(_make_story("1"))
+    job_id = create_video_job(VideoJob(story_id="story_1"))
+
+    _update_video_job_sql.cache_clear()
+    update_video_job(job_id, status="rendering", video_path="/tmp/a.mp4")
+    update_video_job(job_id, video_path="/tmp/b.mp4", status="done")
+    assert _update_video_job_sql.cache_info().hits == 1
+
+    job = get_video_job(job_id)
+    assert (job.status, str(job.video_path)) == ("done", "/tmp/b.mp4")
+
+
+def test_run_keys_jobs_and_output_on_legacy_id(tmp_path, monkeypatch):
+    """`run` on a URL stored under an old-style id renders that row."""
+    import asyncio
+
+    import pipeline
+    from techslop.db import (
+        create_video_job,
+        get_all_stories,
+        get_story,
+        get_video_job,
+        update_job_and_story,
+        upsert_story,
+    )
+
+    monkeypatch.setattr("techslop.config.settings.output_dir", str(tmp_path))
+    upsert_story(_make_story("1", score=10.0))
+
+    async def fake_stream():
+        rehashed = _make_story("1", score=30.0)
+        rehashed.id = "new_style_id"
+        yield rehashed
+
+    jobs = []
+
+    async def fake_process_all(stories, tts, upload, encode_workers, video_encoder):
+        # The DB side of _process_story, without script/voice/video work.
+        results = []
+        for story in stories:
+            job_id = create_video_job(VideoJob(story_id=story.id))
+            update_job_and_story(job_id, story.id, status="rendered")
+            jobs.append(job_id)
+            results.append(pipeline.StoryPaths.for_story(story.id).video)
+        return results
+
+    monkeypatch.setattr("techslop.ingest.sources.ingest_stream", fake_stream)
+    monkeypatch.setattr("techslop.voice.base.TTSProvider.from_config", lambda settings: None)
+    monkeypatch.setattr(pipeline, "_process_all", fake_process_all)
+
+    found, top = asyncio.run(pipeline._ingest_and_store())
+    assert (found, [s.id for s in top]) == (1, ["story_1"])
+
+    stories, results = asyncio.run(pipeline._pipeline_main(1, False, 1, "libx264"))
+    assert [s.id for s in stories] == ["story_1"]
+    assert [(s.id, s.status) for s in get_all_stories()] == [("story_1", "rendered")]
+    assert get_story(get_video_job(jobs[0]).story_id) is not None
+    assert results == [tmp_path / "story_1" / "output.mp4"]
+
+
+def test_run_reaps_tts_warmup_when_ingest_fails(monkeypatch):
+    import asyncio
+
+    import pipeline
+
+    async def failing_stream():
+        raise RuntimeError("sources down")
+        yield
+
+    def failing_warmup(settings):
+        raise RuntimeError("no TTS credentials")
+
+    monkeypatch.setattr("techslop.ingest.sources.ingest_stream", failing_stream)
+    monkeypatch.setattr("techslop.voice.base.TTSProvider.from_config", failing_warmup)
+
+    async def run():
+        with pytest.raises(ExceptionGroup):
+            await pipeline._pipeline_main(1, False, 1, "libx264")
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    assert asyncio.run(run()) == set()
@@ -0,0 +1,30 @@
+"""Tests for techslop.httpclient."""
+
+import asyncio
+
+import pytest
+
+from techslop.httpclient import client_session, current_client, shared_client
+
+
+@pytest.mark.asyncio
+async def test_client_session_reuses_shared_client():
+    assert current_client() is None
+
+    async with shared_client() as shared:
+        async def inner():
+            async with client_session() as c:
+                return c
+
+        # Tasks inherit the context, so gathered stages see the same client.
+        assert await asyncio.gather(inner(), inner()) == [shared, shared]
+
+    assert current_client() is None
+    assert shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_client_session_without_shared_client_is_throwaway():
+    async with client_session(timeout=5) as c:
+        assert not c.is_closed
+    assert c.is_closed
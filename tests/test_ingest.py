@@ -28,8 +28,9 @@ async def test_hackernews_fetch():
         def raise_for_status(self):
             pass
 
-        def json(self):
-            return self._data
+        @property
+        def content(self):
+            return json.dumps(self._data).encode()
 
     class MockClient:
         async def get(self, url):
@@ -41,41 +42,157 @@ async def test_hackernews_fetch():
                 return MockResponse(mock_items[item_id])
             return MockResponse(None)
 
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, *args):
-            pass
-
-    with patch("techslop.ingest.hackernews.httpx.AsyncClient", return_value=MockClient()):
-        from techslop.ingest.hackernews import fetch_hackernews
-        stories = await fetch_hackernews()
+    from techslop.ingest.hackernews import fetch_hackernews
+    stories = await fetch_hackernews(client=MockClient())
 
     assert len(stories) == 3
     # Check that comments were fetched
     story1 = next(s for s in stories if s.title == "Story 1")
     assert "comments" in story1.raw_data
     assert len(story1.raw_data["comments"]) == 2
+    assert "kids" not in story1.raw_data
+
+
+@pytest.mark.asyncio
+async def test_hackernews_fetch_overlaps_requests_within_limit():
+    """Item and comment requests should run concurrently, capped by the semaphore."""
+    import asyncio
+
+    from techslop.ingest import hackernews
+
+    items = {i: {"id": i, "title": f"Story {i}", "url": f"https://x.com/{i}", "time": 0,
+                 "kids": [1000 + i]} for i in range(1, 26)}
+    items.update({1000 + i: {"id": 1000 + i, "by": "u", "text": "hi"} for i in range(1, 26)})
+    in_flight = peak = 0
+
+    class MockResponse:
+        def __init__(self, data):
+            self.content = json.dumps(data).encode()
+
+        def raise_for_status(self):
+            pass
+
+    class MockClient:
+        async def get(self, url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "topstories" in url:
+                return MockResponse(list(range(1, 26)))
+            return MockResponse(items[int(url.split("/item/")[1].removesuffix(".json"))])
+
+    stories = await hackernews.fetch_hackernews(client=MockClient())
+
+    assert len(stories) == 25
+    assert all(s.raw_data["comments"] for s in stories)
+    assert 1 < peak <= hackernews.MAX_CONCURRENT_REQUESTS
+
+
+REDDIT_ATOM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>Post 1</title>
+    <link href="https://reddit.com/1" />
+    <updated>2024-01-01T00:00:00+00:00</updated>
+    <content type="html">&lt;p&gt;Body 1&lt;/p&gt;</content>
+  </entry>
+  <entry>
+    <title>Post 2</title>
+    <link href="https://reddit.com/2" />
+    <published>2024-01-02T12:30:00Z</published>
+  </entry>
+</feed>"""
+
+TECHCRUNCH_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+  <title>TechCrunch</title>
+  <item>
+    <title>Startup raises money</title>
+    <link>https://techcrunch.com/a</link>
+    <pubDate>Mon, 01 Jan 2024 10:00:00 +0000</pubDate>
+    <description>Some summary</description>
+  </item>
+  <item><title>No link</title></item>
+</channel></rss>"""
+
+
+def test_parse_feed_atom_and_rss():
+    """feeds.parse_feed should read both Reddit's Atom and TechCrunch's RSS."""
+    from datetime import datetime, timezone
+
+    from techslop.ingest.feeds import SUMMARY_MAX_CHARS, parse_feed
+
+    atom = parse_feed(REDDIT_ATOM)
+    assert [e.link for e in atom] == ["https://reddit.com/1", "https://reddit.com/2"]
+    assert atom[0].summary == "<p>Body 1</p>"
+    assert atom[1].published_at == datetime(2024, 1, 2, 12, 30, tzinfo=timezone.utc)
+
+    long = REDDIT_ATOM.replace(b"Body 1", b"x" * 5000)
+    assert len(parse_feed(long)[0].summary) == SUMMARY_MAX_CHARS
+
+    rss = parse_feed(TECHCRUNCH_RSS)
+    assert rss[0].title == "Startup raises money"
+    assert rss[0].published_at == datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    assert rss[1].link == ""
+
+
+def test_parse_date_prefers_native_format_with_fallback():
+    from datetime import datetime, timezone
+
+    from techslop.ingest.feeds import _parse_date
+
+    expected = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    # Nitter writes "-0000", which parsedate_to_datetime returns naive.
+    assert _parse_date("Mon, 01 Jan 2024 10:00:00 -0000", rfc822=True) == expected
+    assert _parse_date("2024-01-01T10:00:00Z", rfc822=True) == expected
+    assert _parse_date("Mon, 01 Jan 2024 10:00:00 GMT") == expected
+    assert _parse_date("not a date", rfc822=True) is None
+    assert _parse_date(None) is None
 
 
 @pytest.mark.asyncio
 async def test_reddit_fetch():
     """Reddit fetcher should parse RSS entries."""
-    mock_feed = MagicMock()
-    mock_feed.bozo = False
-    mock_feed.entries = [
-        {"link": "https://reddit.com/1", "title": "Post 1", "published_parsed": (2024, 1, 1, 0, 0, 0, 0, 0, 0)},
-        {"link": "https://reddit.com/2", "title": "Post 2", "published_parsed": (2024, 1, 1, 0, 0, 0, 0, 0, 0)},
-    ]
+    mock_resp = MagicMock()
+    mock_resp.content = REDDIT_ATOM
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_resp
 
-    with patch("techslop.ingest.reddit.feedparser.parse", return_value=mock_feed):
-        with patch("techslop.ingest.reddit.settings") as mock_settings:
-            mock_settings.reddit_subreddits = "technology"
-            from techslop.ingest.reddit import fetch_reddit
-            stories = await fetch_reddit()
+    with patch("techslop.ingest.reddit.settings") as mock_settings:
+        mock_settings.reddit_subreddits = "technology,programming"
+        from techslop.ingest.reddit import fetch_reddit
+        stories = await fetch_reddit(client=mock_client)
 
-    assert len(stories) == 2
+    # One request per subreddit, both feeds parsed.
+    assert mock_client.get.await_count == 2
+    assert len(stories) == 4
     assert all(s.source == "reddit" for s in stories)
+    assert stories[0].raw_data == {"summary": "<p>Body 1</p>"}
+
+
+@pytest.mark.asyncio
+async def test_x_fetch_parses_nitter_rss():
+    """X fetcher should read Nitter RSS, salvaging a truncated feed."""
+    nitter_rss = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+      <item><title>GPU news</title><link>https://nitter.net/a/status/1</link>
+        <pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>
+        <description>&lt;p&gt;New GPU&lt;/p&gt;</description></item>
+      <item><title>Second</title><link>https://nitter.net/b/status/2</link></item>
+      <item><title>Truncat"""
+    mock_resp = MagicMock(status_code=200, content=nitter_rss)
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_resp
+
+    with patch("techslop.ingest.xtwitter.settings") as mock_settings:
+        mock_settings.x_keywords = "gpu"
+        from techslop.ingest.xtwitter import fetch_x
+        stories = await fetch_x(client=mock_client)
+
+    assert [s.url for s in stories] == ["https://nitter.net/a/status/1", "https://nitter.net/b/status/2"]
+    assert stories[0].raw_data == {"tweet_text": "<p>New GPU</p>"}
+    assert stories[1].raw_data == {"tweet_text": "Second"}
 
 
 @pytest.mark.asyncio
@@ -104,8 +221,9 @@ async def test_fourchan_fetch():
             self._data = data
         def raise_for_status(self):
             pass
-        def json(self):
-            return self._data
+        @property
+        def content(self):
+            return json.dumps(self._data).encode()
 
     class MockClient:
         async def get(self, url):
@@ -117,18 +235,117 @@ async def test_fourchan_fetch():
                 return MockResponse(thread_3)
             return MockResponse({"posts": []})
 
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, *args):
-            pass
-
-    with patch("techslop.ingest.fourchan.httpx.AsyncClient", return_value=MockClient()):
-        with patch("techslop.ingest.fourchan.settings") as mock_settings:
-            mock_settings.fourchan_keywords = "AI,LLM,GPU,python"
-            from techslop.ingest.fourchan import fetch_fourchan
-            stories = await fetch_fourchan()
+    with patch("techslop.ingest.fourchan.settings") as mock_settings:
+        mock_settings.fourchan_keywords = "AI,LLM,GPU,python"
+        from techslop.ingest.fourchan import fetch_fourchan
+        stories = await fetch_fourchan(client=MockClient())
 
     # Should match thread 1 (AI, LLMs) and thread 3 (Python, GPU), NOT thread 2 (anime)
     assert len(stories) == 2
     assert all(s.source == "4chan" for s in stories)
+    # Replies share the HN comment shape.
+    ai = next(s for s in stories if s.raw_data["thread_no"] == 1)
+    assert ai.raw_data["comments"] == [
+        {"author": "Anonymous", "text": "Reply 1"},
+        {"author": "Anonymous", "text": "Reply 2"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_yields_best_copy_per_story():
+    """ingest_stream should re-yield a story only when a later copy scores higher."""
+    from datetime import datetime, timezone
+
+    from techslop.ingest import sources
+    from techslop.models import Story
+
+    def _story(id, source, score):
+        return Story(
+            id=id, title=id, url=f"https://example.com/{id}", source=source,
+            score=score, published_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+    async def fetch_a():
+        return [_story("shared", "4chan", 10.0), _story("a", "4chan", 1.0)]
+
+    async def fetch_b():
+        return [_story("shared", "hackernews", 10.0), _story("b", "hackernews", 1.0)]
+
+    with patch.object(sources, "SOURCES", [("a", fetch_a), ("b", fetch_b)]):
+        yielded = [s async for s in sources.ingest_stream()]
+
+    ids = [s.id for s in yielded]
+    assert set(ids) == {"shared", "a", "b"}
+    best_shared = max(s.score for s in yielded if s.id == "shared")
+    # hackernews outweighs 4chan, so the HN copy is the one that wins.
+    assert best_shared == 1.0
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_drops_a_source_that_times_out():
+    import asyncio
+    from datetime import datetime, timezone
+
+    from techslop.ingest import sources
+    from techslop.models import Story
+
+    async def fast():
+        return [Story(id="a", title="a", url="https://example.com/a", source="hackernews",
+                      score=1.0, published_at=datetime(2024, 1, 1, tzinfo=timezone.utc))]
+
+    async def hung():
+        await asyncio.sleep(10)
+        return []
+
+    with patch.object(sources, "SOURCES", [("fast", fast), ("hung", hung)]), \
+            patch.object(sources, "SOURCE_TIMEOUT", 0.05):
+        stories = await sources.ingest_all()
+
+    assert [s.id for s in stories] == ["a"]
+
+
+def test_story_id_is_stable_64_hex():
+    from techslop.ingest.ids import story_id
+
+    sid = story_id("https://example.com/a")
+    assert sid == story_id("https://example.com/a")
+    assert sid != story_id("https://example.com/b")
+    assert len(sid) == 64 and int(sid, 16) >= 0
+    # Lone surrogates (malformed feed text) still hash instead of raising.
+    assert len(story_id("https://example.com/\ud800")) == 64
+
+
+def test_story_id_sha256_flag_reproduces_legacy_ids(monkeypatch):
+    import hashlib
+
+    from techslop.ingest.ids import story_id
+
+    url = "https://example.com/a"
+    monkeypatch.setattr("techslop.config.settings.story_id_hash", "sha256")
+    assert story_id(url) == hashlib.sha256(url.encode()).hexdigest()
+
+
+def test_fourchan_html_text_decodes_entities_and_breaks():
+    from techslop.ingest.fourchan import _html_text, _make_title
+
+    com = '<a href="#p1" class="quotelink">&gt;&gt;1</a><br>Rust &amp; Go<br><span class="quote">&gt;implying</span>'
+    assert _html_text(com) == ">>1\nRust & Go\n>implying"
+    assert _make_title({"com": com}) == ">>1 Rust & Go >implying"
+    assert _html_text("") == ""
+
+
+def test_fourchan_html_text_drops_xml_incompatible_characters():
+    from techslop.ingest.fourchan import _html_text, _make_title
+
+    assert _html_text("Rust\x0b &amp;\x00 Go\ufffe<br>\ud800ok") == "Rust & Go\nok"
+    assert _make_title({"sub": "\x1bGPU\x0c thread"}) == "GPU thread"
+
+
+def test_fourchan_keyword_pattern_is_prefix_factored():
+    from techslop.ingest.fourchan import _keyword_pattern
+
+    pattern = _keyword_pattern(["Python", "programming", "prog", "self-hosted", "GPU"])
+    assert pattern.pattern == r"(?:gpu|p(?:rog|ython)|self\-hosted)"
+    assert pattern.search("New PROGRAMMING language")
+    assert pattern.search("my Self-Hosted setup")
+    assert not pattern.search("gardening thread")
@@ -64,3 +64,29 @@ def test_recency_boost():
     recent = next(s for s in ranked if s.id == "recent")
     old = next(s for s in ranked if s.id == "old")
     assert recent.score > old.score
+
+
+def test_scores_normalized_per_source():
+    stories = [
+        _story("h0", source="hackernews", score=0.0, hours_ago=24.0),
+        _story("h1", source="hackernews", score=50.0, hours_ago=24.0),
+        _story("h2", source="hackernews", score=100.0, hours_ago=24.0),
+        _story("r0", source="reddit", score=7.0, hours_ago=24.0),
+        _story("r1", source="reddit", score=7.0, hours_ago=1.0),
+        _story("u0", source="unknown", score=3.0, hours_ago=24.0),
+    ]
+    scores = {s.id: s.score for s in score_and_rank(stories)}
+    assert scores["h0"] == 0.0
+    assert scores["h1"] == 0.5
+    assert scores["h2"] == 1.0
+    # Identical scores normalize to 1.0 before the 0.8 reddit weight.
+    assert scores["r0"] == 0.8
+    assert abs(scores["r1"] - 0.95) < 1e-9
+    # Unknown sources get the 0.5 default weight.
+    assert scores["u0"] == 0.5
+
+
+def test_score_and_rank_top_k():
+    stories = [_story(str(i), score=float(i)) for i in range(10)]
+    ranked = score_and_rank(stories, top_k=3)
+    assert [s.id for s in ranked] == ["9", "8", "7"]
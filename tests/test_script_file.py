@@ -0,0 +1,30 @@
+"""Tests for techslop.scriptgen.script_file."""
+
+from techslop.models import Script, ScriptSection
+from techslop.scriptgen.script_file import load_script, save_script
+
+
+def test_round_trip(tmp_path):
+    script = Script(
+        story_id="abc",
+        hook="Breaking news!",
+        body=[ScriptSection(text="First point.", screen_text="POINT 1", duration_hint=5.0)],
+        cta="Follow for more.",
+        full_text="Breaking news! First point. Follow for more.",
+    )
+    path = tmp_path / "script.json"
+    save_script(script, path)
+
+    assert path.read_text().startswith('{\n  "story_id": "abc"')
+    assert load_script(path, "other") == script
+
+
+def test_hand_written_file_without_story_id(tmp_path):
+    path = tmp_path / "script.json"
+    path.write_text(
+        '{"hook": "H", "body": [{"text": "T", "screen_text": "S", "duration_hint": 7}],'
+        ' "cta": "C", "full_text": "H T C", "notes": "ignored"}'
+    )
+    script = load_script(path, "fallback")
+    assert script.story_id == "fallback"
+    assert script.body[0].duration_hint == 7.0
@@ -0,0 +1,27 @@
+"""Tests for techslop.video.stamps."""
+
+from techslop.video.stamps import input_digest, is_fresh, write_stamp
+
+
+def test_digest_tracks_file_contents(tmp_path):
+    src = tmp_path / "timestamps.json"
+    src.write_text("[1]")
+    before = input_digest("title", src)
+    assert input_digest("title", src) == before
+
+    src.write_text("[2]")
+    assert input_digest("title", src) != before
+    assert input_digest("a", "bc") != input_digest("ab", "c")
+
+
+def test_is_fresh_requires_output_and_matching_stamp(tmp_path):
+    out = tmp_path / "output.mp4"
+    assert not is_fresh(out, "abc")
+
+    out.write_bytes(b"video")
+    assert not is_fresh(out, "abc")
+
+    write_stamp(out, "abc")
+    assert (tmp_path / "output.stamp").read_text() == "abc"
+    assert is_fresh(out, "abc")
+    assert not is_fresh(out, "def")